@@ -1,12 +1,19 @@
 import os
+import logging
+import threading
+import time
 from dotenv import load_dotenv
 
 from DB.config import DataBaseConfig
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class Singleton(type):
@@ -18,19 +25,111 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+class TimedQueuePool(QueuePool):
+    """QueuePool, который считает время выдачи соединений из пула"""
+
+    wait_warning: float = DataBaseConfig.DB_POOL_WAIT_WARNING
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            with self.stats_lock:
+                self.checkouts += 1
+                self.timeouts += timed_out
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+
+            if wait > self.wait_warning:
+                logger.warning(f"Ожидание соединения из пула заняло {wait:.3f} с ({self.status()})")
+
+    def get_stats(self) -> dict:
+        with self.stats_lock:
+            return {
+                "size": self.size(),
+                "checked_in": self.checkedin(),
+                "checked_out": self.checkedout(),
+                "overflow": self.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total": round(self.wait_total, 6),
+                "wait_avg": round(self.wait_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_max": round(self.wait_max, 6),
+            }
+
+
 class SessionMaker(DataBaseConfig, metaclass=Singleton):
     """Basic class which make sessions"""
 
     def __init__(self, echo: bool = False):
         self.echo = echo
         self.engine = create_engine(
-            f"{self.DB_TYPE}+"
-            f"{self.DB_CONN}://"
-            f"{self.DB_USER}:"
-            f"{self.DB_PASS}@"
-            f"{self.DB_HOST}:"
-            f"{self.DB_PORT}/"
-            f"{self.DB_NAME}",
+            self.get_url(self.DB_CONN),
             echo=echo,
+            poolclass=TimedQueuePool,
+            pool_size=self.DB_POOL_SIZE,
+            max_overflow=self.DB_MAX_OVERFLOW,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+            pool_recycle=self.DB_POOL_RECYCLE,
+            pool_pre_ping=self.DB_POOL_PRE_PING,
         )
         self.session_factory = sessionmaker(self.engine, expire_on_commit=False)
+
+        # Воркеры Celery (prefork) и gunicorn создаются через fork()
+        os.register_at_fork(after_in_child=self.reset_after_fork)
+
+    def reset_after_fork(self):
+        """
+        Заменяет пул в дочернем процессе после fork().
+
+        Унаследованные соединения принадлежат родителю: закрывать их нельзя,
+        поэтому пул пересоздаётся без close, а дочерний процесс открывает свои.
+        """
+        self.engine.dispose(close=False)
+
+    def pool_stats(self) -> dict:
+        """Состояние пула и время выдачи соединений в текущем процессе"""
+        return self.engine.pool.get_stats()
+
+
+class AsyncSessionMaker(DataBaseConfig, metaclass=Singleton):
+    """
+    Асинхронный аналог SessionMaker на asyncpg для бота и парсеров.
+
+    Соединения asyncpg привязаны к циклу событий, в котором открыты, поэтому
+    в процессе должен работать один цикл (asyncio.run в bot_start.py или в
+    __main__ парсера), а не asyncio.run на каждый вызов.
+    """
+
+    def __init__(self, echo: bool = False):
+        self.echo = echo
+        self.engine = create_async_engine(
+            self.get_url(self.DB_ASYNC_CONN),
+            echo=echo,
+            pool_size=self.DB_POOL_SIZE,
+            max_overflow=self.DB_MAX_OVERFLOW,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+            pool_recycle=self.DB_POOL_RECYCLE,
+            pool_pre_ping=self.DB_POOL_PRE_PING,
+        )
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        os.register_at_fork(after_in_child=self.reset_after_fork)
+
+    def reset_after_fork(self):
+        """Заменяет пул в дочернем процессе после fork(), см. SessionMaker.reset_after_fork"""
+        self.engine.sync_engine.dispose(close=False)
@@ -1,16 +1,61 @@
 from datetime import datetime
-from enum import Enum
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Select, select, update, delete
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from DB.DataBase import SessionMaker
+from DB.DataBase import SessionMaker, AsyncSessionMaker
+from DB.pagination import get_page, PAGE_DEFAULT_LIMIT
+from DB.uuids import get_uuids
 from DB.models.FSPevent import FSPEvents
 from DB.models.enums.regions import Regions
 from DB.models.enums.FSPevent_status import FSPEventStatus
+from DB.models.enums.lookup import to_enum
+
+
+# Поля строк списка FSP событий в порядке колонок запроса
+FSPEVENT_ROW_FIELDS = (
+    "id",
+    "sport",
+    "title",
+    "description",
+    "admin_description",
+    "participants",
+    "participants_num",
+    "discipline",
+    "region",
+    "representative",
+    "files",
+    "place",
+    "date_start",
+    "date_end",
+    "status",
+)
+FSPEVENT_ROW_COLUMNS = tuple(getattr(FSPEvents, field) for field in FSPEVENT_ROW_FIELDS)
 
 
 class FSPevent:
+    __slots__ = (
+        "id",
+        "event_id",
+        "sport",
+        "title",
+        "description",
+        "admin_description",
+        "participants",
+        "participants_num",
+        "discipline",
+        "place",
+        "region",
+        "status",
+        "representative",
+        "files",
+        "date_start",
+        "date_end",
+        "auto_add",
+    )
+
     def __init__(
             self,
             id: str | None = None,
@@ -30,8 +75,6 @@ class FSPevent:
             status: FSPEventStatus | None = None,
             auto_add: bool = False,
     ):
-        self.sessionmaker: sessionmaker = SessionMaker().session_factory
-
         self.id: str | None = id
         self.event_id: str | None = id
 
@@ -61,6 +104,14 @@ class FSPevent:
         if self.auto_add:
             pass
 
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
+    @property
+    def async_sessionmaker(self) -> async_sessionmaker:
+        return AsyncSessionMaker().session_factory
+
     def add(self):
         try:
             with self.sessionmaker() as session:
@@ -74,95 +125,183 @@ class FSPevent:
             print(e)
             return False
 
+    async def add_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                event: FSPEvents = FSPEvents(**self.get_self())
+                session.add(event)
+                await session.flush()
+                self.id = str(event.id)
+                await session.commit()
+                return True
+        except Exception as e:
+            print(e)
+            return False
+
     def get(self):
         try:
             with self.sessionmaker() as session:
-                query = select(FSPEvents).filter_by(id=self.id)
-                event: FSPEvents | None = session.execute(query).scalar_one_or_none()
+                event: FSPEvents | None = session.execute(self.get_query()).scalar_one_or_none()
                 if event is None:
                     return None
 
-                self.sport = event.sport
-                self.title = event.title
-                self.description = event.description
-                self.admin_description = event.admin_description
-                self.participants = event.participants
-                self.participants_num = event.participants_num
-                self.discipline = event.discipline
-                self.region = event.region
-                self.representative = event.representative
-                self.files = event.files if event.files is not None else []
-                self.place = event.place
-                self.date_start = event.date_start
-                self.date_end = event.date_end
-                self.status = event.status
+                self.set_from_model(event)
+                return self
+        except Exception as e:
+            print(e)
+            return None
 
+    async def get_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                event: FSPEvents | None = (await session.execute(self.get_query())).scalar_one_or_none()
+                if event is None:
+                    return None
+
+                self.set_from_model(event)
                 return self
         except Exception as e:
             print(e)
             return None
-        
+
+    def get_query(self) -> Select:
+        return select(FSPEvents).filter_by(id=self.id)
+
+    def set_from_model(self, event: FSPEvents):
+        self.sport = event.sport
+        self.title = event.title
+        self.description = event.description
+        self.admin_description = event.admin_description
+        self.participants = event.participants
+        self.participants_num = event.participants_num
+        self.discipline = event.discipline
+        self.region = event.region
+        self.representative = event.representative
+        self.files = event.files if event.files is not None else []
+        self.place = event.place
+        self.date_start = event.date_start
+        self.date_end = event.date_end
+        self.status = event.status
+
+    def get_many(self, ids) -> dict[str, "FSPevent"]:
+        """
+        Загружает события по списку id одним запросом WHERE id IN (...).
+
+        Args:
+            ids: id событий; повторы, None и значения, не являющиеся UUID, пропускаются
+
+        Returns:
+            dict[str, FSPevent]: найденные события по id в том виде, в каком он
+                передан, в порядке ids
+        """
+        ids = get_uuids(ids)
+        if not ids:
+            return {}
+
+        try:
+            with self.sessionmaker() as session:
+                models = {
+                    event.id: event
+                    for event in session.scalars(self.get_many_query(set(ids.values())))
+                }
+        except Exception as e:
+            print(e)
+            raise e
+
+        res = {}
+        for id, event_uuid in ids.items():
+            model = models.get(event_uuid)
+            if model is None:
+                continue
+
+            event = FSPevent(id=str(model.id))
+            event.set_from_model(model)
+            res[id] = event
+
+        return res
+
+    @staticmethod
+    def get_many_query(ids) -> Select:
+        return select(FSPEvents).where(FSPEvents.id.in_(ids))
+
     def get_by_self(self):
         try:
             with self.sessionmaker() as session:
-                query = select(FSPEvents).filter(
-                    FSPEvents.title == self.title,
-                    FSPEvents.description == self.description,
-                    FSPEvents.place == self.place,
-                    FSPEvents.region == self.region.name,
-                )
-                event: FSPEvents | None = session.execute(query).scalar()
+                event: FSPEvents | None = session.execute(self.get_by_self_query()).scalar()
                 return event
         except Exception as e:
             print(f"Error in get_by_self: {e}")
             return None
 
-    def convert_region_to_key(self):
-        if isinstance(self.region, Enum):
-            return
+    async def get_by_self_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.execute(self.get_by_self_query())).scalar()
+        except Exception as e:
+            print(f"Error in get_by_self_async: {e}")
+            return None
 
-        for reg in Regions:
-            if reg.value == self.region or reg.name == self.region:
-                self.region = reg
-                return
+    def get_by_self_query(self) -> Select:
+        return select(FSPEvents).filter(
+            FSPEvents.title == self.title,
+            FSPEvents.description == self.description,
+            FSPEvents.place == self.place,
+            FSPEvents.region == self.region.name,
+        )
 
-    def convert_status_to_key(self):
-        if isinstance(self.status, Enum):
-            return
+    def convert_region_to_key(self):
+        self.region = to_enum(Regions, self.region)
 
-        for status in FSPEventStatus:
-            if status.value == self.status or status.name == self.status:
-                self.status = status
-                return
+    def convert_status_to_key(self):
+        self.status = to_enum(FSPEventStatus, self.status)
 
-    def get_by_filters(self):
+    def get_by_filters(self) -> list["FSPeventRow"]:
+        """FSP события по фильтрам в виде FSPeventRow, без сборки обёрток FSPevent"""
         try:
             with self.sessionmaker() as session:
-                query = select(FSPEvents)
-                filters = self.get_filters()
-                if filters:
-                    query = query.filter_by(**filters)
-
-                if self.date_start is not None:
-                    query = query.filter(FSPEvents.date_start >= self.date_start)
-                if self.date_end is not None:
-                    query = query.filter(FSPEvents.date_end <= self.date_end)
-
-                events: list[FSPEvents] = session.scalars(query).all()
-                if events is None:
-                    return []
-                
-                res = []
-                for event in events:
-                    e = FSPevent(**self.get_from_model(event))
-                    e.event_id = event.id
-                    res.append(e)
-
-                return res
+                rows = session.execute(self.get_by_filters_query(*FSPEVENT_ROW_COLUMNS)).all()
+                return [FSPeventRow(*row) for row in rows]
         except Exception as e:
             print(f"Error in get_by_filters: {e}")
             return []
 
+    async def get_by_filters_async(self) -> list["FSPeventRow"]:
+        try:
+            async with self.async_sessionmaker() as session:
+                rows = (await session.execute(self.get_by_filters_query(*FSPEVENT_ROW_COLUMNS))).all()
+                return [FSPeventRow(*row) for row in rows]
+        except Exception as e:
+            print(f"Error in get_by_filters_async: {e}")
+            return []
+
+    def get_by_filters_page(self, limit: int = PAGE_DEFAULT_LIMIT, cursor: str | None = None, with_total: bool = False) -> dict:
+        """Страница get_by_filters в порядке (date_start, id), см. DB.pagination.get_page"""
+        try:
+            with self.sessionmaker() as session:
+                query = self.get_by_filters_query(*FSPEVENT_ROW_COLUMNS)
+                page = get_page(session, query, FSPEvents, limit, cursor, with_total, False)
+                page["items"] = [FSPeventRow(*row) for row in page["items"]]
+                return page
+        except Exception as e:
+            print(f"Error in get_by_filters_page: {e}")
+            raise e
+
+    def get_by_filters_query(self, *columns) -> Select:
+        query = select(*columns) if columns else select(FSPEvents)
+        filters = self.get_filters()
+        if filters:
+            query = query.filter_by(**filters)
+
+        if self.date_start is not None and self.date_end is not None:
+            # Событие целиком внутри [date_start, date_end]: <@ по GiST индексу date_range
+            query = query.filter(FSPEvents.date_range.contained_by(Range(self.date_start, self.date_end, bounds="[]")))
+        elif self.date_start is not None:
+            query = query.filter(FSPEvents.date_start >= self.date_start)
+        elif self.date_end is not None:
+            query = query.filter(FSPEvents.date_end <= self.date_end)
+
+        return query
+
     def get_from_model(self, model):
         return {
             "id": model.id,
@@ -201,8 +340,7 @@ class FSPevent:
     def get_all(self):
         try:
             with self.sessionmaker() as session:
-                query = select(FSPEvents)
-                events: list[FSPEvents] = session.execute(query).scalars().all()
+                events: list[FSPEvents] = session.execute(select(FSPEvents)).scalars().all()
                 if len(events) == 0:
                     return []
 
@@ -211,6 +349,14 @@ class FSPevent:
             print(e)
             return []
 
+    async def get_all_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.execute(select(FSPEvents))).scalars().all()
+        except Exception as e:
+            print(e)
+            return []
+
     def get_self(self) -> dict:
         return {
             "sport": "Спортивное программирование",
@@ -302,3 +448,54 @@ class FSPevent:
 
         if data.get("date_end") is not None:
             self.date_end = datetime.strptime(data["date_end"], "%Y-%m-%d")
+
+
+class FSPeventRow:
+    """
+    Строка списка FSP событий: только поля FSPEVENT_ROW_FIELDS.
+
+    region и status уже приходят из БД как Regions и FSPEventStatus,
+    поэтому строка не обращается к SessionMaker и не перебирает enum.
+    """
+
+    __slots__ = FSPEVENT_ROW_FIELDS
+
+    def __init__(
+            self,
+            id,
+            sport,
+            title,
+            description,
+            admin_description,
+            participants,
+            participants_num,
+            discipline,
+            region,
+            representative,
+            files,
+            place,
+            date_start,
+            date_end,
+            status,
+    ):
+        self.id = id
+        self.sport = sport
+        self.title = title
+        self.description = description
+        self.admin_description = admin_description
+        self.participants = participants
+        self.participants_num = participants_num
+        self.discipline = discipline
+        self.region = region
+        self.representative = representative
+        self.files = files
+        self.place = place
+        self.date_start = date_start
+        self.date_end = date_end
+        self.status = status
+
+    @property
+    def event_id(self):
+        return self.id
+
+    get_self = FSPevent.get_self
@@ -1,16 +1,35 @@
 from datetime import datetime
-from enum import Enum
 
-from sqlalchemy import select, delete
+from sqlalchemy import Select, select, delete
 from sqlalchemy.orm import sessionmaker
 
 from DB.DataBase import SessionMaker
+from DB.pagination import get_page, PAGE_DEFAULT_LIMIT
 from DB.models.FSPevent_archive import FSPevent_archive as FSPevent_archive_model
 from DB.models.enums.regions import Regions
 from DB.models.enums.FSPevent_status import FSPEventStatus
+from DB.models.enums.lookup import to_enum
 
 
 class FSPevent_archive:
+    __slots__ = (
+        "id",
+        "sport",
+        "title",
+        "description",
+        "admin_description",
+        "discipline",
+        "participants",
+        "participants_num",
+        "region",
+        "place",
+        "representative",
+        "date_start",
+        "date_end",
+        "status",
+        "files",
+    )
+
     def __init__(
             self,
             id: str | None = None,
@@ -29,8 +48,6 @@ class FSPevent_archive:
             status: FSPEventStatus | None = None,
             files: list | None = None,
     ):
-        self.sessionmaker: sessionmaker = SessionMaker().session_factory
-
         self.id: str | None = id
 
         self.sport: str | None = sport
@@ -55,6 +72,10 @@ class FSPevent_archive:
         self.convert_region_to_key()
         self.convert_status_to_key()
 
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
     def add(self) -> bool:
         try:
             with self.sessionmaker() as session:
@@ -118,22 +139,10 @@ class FSPevent_archive:
             return None
 
     def convert_region_to_key(self):
-        if isinstance(self.region, Enum):
-            return
-
-        for reg in Regions:
-            if reg.value == self.region or reg.name == self.region:
-                self.region = reg
-                return
+        self.region = to_enum(Regions, self.region)
 
     def convert_status_to_key(self):
-        if isinstance(self.status, Enum):
-            return
-
-        for status in FSPEventStatus:
-            if status.value == self.status or status.name == self.status:
-                self.status = status
-                return
+        self.status = to_enum(FSPEventStatus, self.status)
 
     def get_self(self) -> dict:
         return {
@@ -174,17 +183,7 @@ class FSPevent_archive:
     def get_by_filters(self):
         try:
             with self.sessionmaker() as session:
-                query = select(FSPevent_archive_model)
-                filters = self.get_filters()
-                if filters:
-                    query = query.filter_by(**filters)
-
-                if self.date_start is not None:
-                    query = query.filter(FSPevent_archive_model.date_start >= self.date_start)
-                if self.date_end is not None:
-                    query = query.filter(FSPevent_archive_model.date_end <= self.date_end)
-
-                events: list[FSPevent_archive_model] = session.scalars(query).all()
+                events: list[FSPevent_archive_model] = session.scalars(self.get_by_filters_query()).all()
                 if events is None:
                     return []
 
@@ -193,6 +192,30 @@ class FSPevent_archive:
             print(f"Error in get_by_filters: {e}")
             return []
 
+    def get_by_filters_page(self, limit: int = PAGE_DEFAULT_LIMIT, cursor: str | None = None, with_total: bool = False) -> dict:
+        """Страница get_by_filters в порядке (date_start, id), см. DB.pagination.get_page"""
+        try:
+            with self.sessionmaker() as session:
+                page = get_page(session, self.get_by_filters_query(), FSPevent_archive_model, limit, cursor, with_total)
+                page["items"] = [FSPevent_archive(**self.get_from_model(event)) for event in page["items"]]
+                return page
+        except Exception as e:
+            print(f"Error in get_by_filters_page: {e}")
+            raise e
+
+    def get_by_filters_query(self) -> Select:
+        query = select(FSPevent_archive_model)
+        filters = self.get_filters()
+        if filters:
+            query = query.filter_by(**filters)
+
+        if self.date_start is not None:
+            query = query.filter(FSPevent_archive_model.date_start >= self.date_start)
+        if self.date_end is not None:
+            query = query.filter(FSPevent_archive_model.date_end <= self.date_end)
+
+        return query
+
     def get_from_model(self, model):
         return {
             "id": model.id,
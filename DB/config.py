@@ -12,4 +12,25 @@ class DataBaseConfig:
     DB_PORT = 5432
     DB_NAME = "hakaton"
     DB_CONN = "psycopg2"
+    DB_ASYNC_CONN = "asyncpg"
     DB_TYPE = "postgresql"
+
+    # Пул соединений: размер подбирается под число потоков/процессов приложения
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "1") == "1"
+    # Ожидание свободного соединения дольше этого порога (в секундах) пишется в лог
+    DB_POOL_WAIT_WARNING = float(os.environ.get("DB_POOL_WAIT_WARNING", 1))
+
+    def get_url(self, conn: str) -> str:
+        return (
+            f"{self.DB_TYPE}+"
+            f"{conn}://"
+            f"{self.DB_USER}:"
+            f"{self.DB_PASS}@"
+            f"{self.DB_HOST}:"
+            f"{self.DB_PORT}/"
+            f"{self.DB_NAME}"
+        )
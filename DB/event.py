@@ -1,14 +1,107 @@
+import csv
+import hashlib
+import logging
+import io
+import itertools
+import json
+import random
+import time
+import uuid
 from datetime import datetime
+from typing import Iterable
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import sessionmaker
-
+from sqlalchemy import (
+    Select, select, func, insert, update, delete, exists, literal, cast, text,
+    Table, Column, MetaData, String, DateTime, Integer, Float, union_all, values, column, true,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.postgresql import BIGINT, JSONB, Range
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import sessionmaker, aliased
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from DB.models.Base import get_datetime_UTC
 from DB.models.event import Events
-from DB.DataBase import SessionMaker
+from DB.DataBase import SessionMaker, AsyncSessionMaker
+from DB.pagination import get_page, PAGE_DEFAULT_LIMIT
+
+# Поля записи ЕКП, которые приходят из парсера и входят в хеш содержимого
+SYNC_FIELDS = (
+    "sport",
+    "title",
+    "participants",
+    "participants_num",
+    "discipline",
+    "place",
+    "date_start",
+    "date_end",
+)
+
+logger = logging.getLogger(__name__)
+
+# Колонки events, которые заполняет массовая загрузка
+BULK_COLUMNS = ("id", "event_id", *SYNC_FIELDS, "content_hash", "gender", "created_at", "updated_at")
+BULK_BATCH_SIZE = 5000
+
+# Теневая таблица для полной перезагрузки и предыдущий снимок для отката
+SHADOW_TABLE = "events_shadow"
+PREVIOUS_TABLE = "events_previous"
+SWAP_LOCK_TIMEOUT = "5s"
+SWAP_ATTEMPTS = 3
+
+
+# Колонки списков событий (/api/events): без gender, content_hash и служебных дат
+EVENT_LIST_COLUMNS = (
+    Events.id,
+    Events.event_id,
+    Events.sport,
+    Events.title,
+    Events.participants,
+    Events.participants_num,
+    Events.discipline,
+    Events.place,
+    Events.date_start,
+    Events.date_end,
+)
+
+
+def get_sync_staging_table() -> Table:
+    """Временная таблица для загрузки нового набора событий, удаляется при commit."""
+    return Table(
+        "events_sync",
+        MetaData(),
+        Column("event_id", BIGINT, primary_key=True, autoincrement=False),
+        Column("sport", String),
+        Column("title", String),
+        Column("participants", String),
+        Column("participants_num", String),
+        Column("discipline", String),
+        Column("place", String),
+        Column("date_start", DateTime),
+        Column("date_end", DateTime),
+        Column("content_hash", String),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
 
 
 class Event:
+    __slots__ = (
+        "event_id",
+        "sport",
+        "title",
+        "participants",
+        "participants_num",
+        "discipline",
+        "place",
+        "date_start",
+        "date_end",
+        "gender",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         event_id: int | None = None,
@@ -22,8 +115,6 @@ class Event:
         date_end: datetime | None = None,
         gender: list[str] | None = None,
     ):
-        self.sessionmaker: sessionmaker = SessionMaker().session_factory
-
         self.event_id: int | None = event_id
         self.sport: str | None = sport
 
@@ -41,11 +132,18 @@ class Event:
         self.created_at: datetime | None = None
         self.updated_at: datetime | None = None
 
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
+    @property
+    def async_sessionmaker(self) -> async_sessionmaker:
+        return AsyncSessionMaker().session_factory
+
     def get_all(self) -> list[Events]:
         try:
             with self.sessionmaker() as session:
-                query = select(Events)
-                events: list[Events] = session.scalars(query).all()
+                events: list[Events] = session.scalars(select(Events)).all()
 
                 if events is None:
                     raise Exception("Events table is empty")
@@ -55,6 +153,14 @@ class Event:
             print(e)
             raise e
 
+    async def get_all_async(self) -> list[Events]:
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.scalars(select(Events))).all()
+        except Exception as e:
+            print(e)
+            raise e
+
     def create(self):
         try:
             with self.sessionmaker() as session:
@@ -107,11 +213,14 @@ class Event:
             print(e)
             raise e
 
+    @staticmethod
+    def get_disciplines_by_sport_query(sport: str) -> Select:
+        return select(Events.discipline).distinct().where(Events.sport == sport)
+
     def get_disciplines_by_sport(self, sport: str) -> list[str]:
         try:
             with self.sessionmaker() as session:
-                query = select(Events.discipline).distinct().where(Events.sport == sport)
-                disciplines = session.scalars(query).all()
+                disciplines = session.scalars(self.get_disciplines_by_sport_query(sport)).all()
                 if disciplines is None:
                     raise Exception("Can't find disciplines by sport")
 
@@ -121,20 +230,35 @@ class Event:
             print(e)
             raise e
 
-    def get_by_filters(self):
+    async def get_disciplines_by_sport_async(self, sport: str) -> list[str]:
         try:
-            with self.sessionmaker() as session:
-                query = select(Events)
-                filters = self.get_filters()
-                if filters:
-                    query = query.filter_by(**filters)
+            async with self.async_sessionmaker() as session:
+                return (await session.scalars(self.get_disciplines_by_sport_query(sport))).all()
+        except Exception as e:
+            print(e)
+            raise e
+
+    def get_by_filters_query(self, *columns) -> Select:
+        query = select(*columns) if columns else select(Events)
+        filters = self.get_filters()
+        if filters:
+            query = query.filter_by(**filters)
 
-                if self.date_start is not None:
-                    query = query.filter(Events.date_start >= self.date_start)
-                if self.date_end is not None:
-                    query = query.filter(Events.date_end <= self.date_end)
+        if self.date_start is not None and self.date_end is not None:
+            # Событие целиком внутри [date_start, date_end]: <@ по GiST индексу date_range
+            query = query.filter(Events.date_range.contained_by(Range(self.date_start, self.date_end, bounds="[]")))
+        elif self.date_start is not None:
+            query = query.filter(Events.date_start >= self.date_start)
+        elif self.date_end is not None:
+            query = query.filter(Events.date_end <= self.date_end)
 
-                events: list[Events] = session.scalars(query).all()
+        return query
+
+    def get_by_filters(self) -> list[Row]:
+        """События по фильтрам: строки только с колонками EVENT_LIST_COLUMNS"""
+        try:
+            with self.sessionmaker() as session:
+                events: list[Row] = session.execute(self.get_by_filters_query(*EVENT_LIST_COLUMNS)).all()
                 if events is None:
                     return []
 
@@ -144,6 +268,43 @@ class Event:
             print(e)
             raise e
 
+    def get_by_filters_page(self, limit: int = PAGE_DEFAULT_LIMIT, cursor: str | None = None, with_total: bool = False) -> dict:
+        """Страница get_by_filters в порядке (date_start, id), см. DB.pagination.get_page"""
+        try:
+            with self.sessionmaker() as session:
+                return get_page(
+                    session, self.get_by_filters_query(*EVENT_LIST_COLUMNS), Events, limit, cursor, with_total, False
+                )
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def get_by_filters_async(self) -> list[Row]:
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.execute(self.get_by_filters_query(*EVENT_LIST_COLUMNS))).all()
+        except Exception as e:
+            print(e)
+            raise e
+
+    def search_query(self, search: str, *columns) -> Select:
+        """
+        get_by_filters_query с поиском подстроки search в названии без учёта регистра.
+
+        ILIKE '%...%' обслуживает триграммный GIN индекс ix_events_title_trgm.
+        """
+        search = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self.get_by_filters_query(*columns).where(Events.title.ilike(f"%{search}%", escape="\\"))
+
+    def search(self, search: str) -> list[Row]:
+        """События по фильтрам, в названии которых есть search"""
+        try:
+            with self.sessionmaker() as session:
+                return session.execute(self.search_query(search, *EVENT_LIST_COLUMNS)).all()
+        except Exception as e:
+            print(e)
+            raise e
+
     def get_by_id(self, event_id: int):
         try:
             with self.sessionmaker() as session:
@@ -157,6 +318,349 @@ class Event:
             print(e)
             raise e
 
+    def sync(self, events: Iterable[dict]) -> dict:
+        """
+        Синхронизирует таблицу events с новым набором записей ЕКП по event_id.
+
+        Записи загружаются во временную таблицу, после чего одним UPDATE
+        обновляются строки с изменившимся хешем содержимого, одним INSERT
+        добавляются новые и одним DELETE удаляются пропавшие. Всё выполняется
+        в одной транзакции, поэтому читатели видят либо старый, либо новый набор.
+
+        Args:
+            events (Iterable[dict]): Записи в формате parsing.fn.iter_pdf_events
+
+        Returns:
+            dict: Количество добавленных, обновлённых, удалённых и неизменённых записей
+        """
+        try:
+            with self.sessionmaker() as session:
+                staging = get_sync_staging_table()
+                staging.create(session.connection())
+                loaded = self.copy_rows(
+                    session, staging, [column.name for column in staging.columns], self.iter_sync_rows(events)
+                )
+                if loaded == 0:
+                    raise Exception("Empty events set, sync skipped")
+
+                now = get_datetime_UTC()
+                columns = [getattr(Events, field) for field in SYNC_FIELDS]
+                staging_columns = [staging.c[field] for field in SYNC_FIELDS]
+
+                updated = session.execute(
+                    update(Events)
+                    .where(
+                        Events.event_id == staging.c.event_id,
+                        Events.content_hash.is_distinct_from(staging.c.content_hash),
+                    )
+                    .values(
+                        {
+                            **{field: staging.c[field] for field in SYNC_FIELDS},
+                            "content_hash": staging.c.content_hash,
+                            "updated_at": now,
+                        }
+                    )
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+
+                inserted = session.execute(
+                    insert(Events).from_select(
+                        [
+                            Events.id, Events.event_id, *columns, Events.content_hash,
+                            Events.gender, Events.created_at, Events.updated_at,
+                        ],
+                        select(
+                            func.gen_random_uuid(), staging.c.event_id, *staging_columns,
+                            staging.c.content_hash, cast(literal("[]"), JSONB),
+                            literal(now, DateTime), literal(now, DateTime),
+                        ).where(~exists().where(Events.event_id == staging.c.event_id)),
+                    )
+                ).rowcount
+
+                deleted = session.execute(
+                    delete(Events)
+                    .where(~exists().where(staging.c.event_id == Events.event_id))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+
+                session.commit()
+
+                return {
+                    "inserted": inserted,
+                    "updated": updated,
+                    "deleted": deleted,
+                    "unchanged": loaded - inserted - updated,
+                }
+        except Exception as e:
+            print(e)
+            raise e
+
+    def bulk_load(self, events: Iterable[dict], batch_size: int = BULK_BATCH_SIZE) -> dict:
+        """
+        Массово загружает записи ЕКП в таблицу events одной транзакцией.
+
+        Предназначена для полной загрузки в пустую таблицу: строки не сверяются
+        с существующими, для обновления используйте sync.
+
+        Args:
+            events (Iterable[dict]): Записи в формате parsing.fn.iter_pdf_events
+            batch_size (int): Количество строк в одной пачке COPY/INSERT
+
+        Returns:
+            dict: Количество загруженных строк, время и скорость загрузки
+        """
+        try:
+            start = time.perf_counter()
+            now = get_datetime_UTC()
+            rows = (
+                {**row, "id": uuid.uuid4(), "gender": [], "created_at": now, "updated_at": now}
+                for row in self.iter_sync_rows(events)
+            )
+
+            with self.sessionmaker() as session:
+                loaded = self.copy_rows(session, Events.__table__, BULK_COLUMNS, rows, batch_size)
+                session.commit()
+
+            seconds = time.perf_counter() - start
+            return {
+                "rows": loaded,
+                "seconds": seconds,
+                "rows_per_second": loaded / seconds if seconds > 0 else 0,
+            }
+        except Exception as e:
+            print(e)
+            raise e
+
+    def reload(self, events: Iterable[dict], batch_size: int = BULK_BATCH_SIZE) -> dict:
+        """
+        Полностью перезагружает events через теневую таблицу.
+
+        Новый набор загружается в events_shadow, для неё строятся те же индексы,
+        что и у events, после чего таблицы меняются местами переименованием в
+        одной короткой транзакции. Читатели видят либо старый, либо новый снимок.
+        Старая таблица сохраняется как events_previous до следующей перезагрузки,
+        откатиться на неё можно через rollback_reload.
+
+        Returns:
+            dict: Количество загруженных строк, время и скорость загрузки
+        """
+        try:
+            start = time.perf_counter()
+            now = get_datetime_UTC()
+            rows = (
+                {**row, "id": uuid.uuid4(), "gender": [], "created_at": now, "updated_at": now}
+                for row in self.iter_sync_rows(events)
+            )
+
+            with self.sessionmaker() as session:
+                indexes = self.get_table_indexes(session, Events.__tablename__)
+
+                session.execute(text(f"DROP TABLE IF EXISTS {SHADOW_TABLE}"))
+                session.execute(text(
+                    f"CREATE TABLE {SHADOW_TABLE} (LIKE {Events.__tablename__} "
+                    f"INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)"
+                ))
+                shadow = Events.__table__.to_metadata(MetaData(), name=SHADOW_TABLE)
+                loaded = self.copy_rows(session, shadow, BULK_COLUMNS, rows, batch_size)
+                if loaded == 0:
+                    raise Exception("Empty events set, reload skipped")
+
+                for name, index_def, constraint_def in indexes:
+                    if constraint_def is not None:
+                        session.execute(text(
+                            f"ALTER TABLE {SHADOW_TABLE} ADD CONSTRAINT {self.get_shadow_index_name(name)} "
+                            f"{constraint_def}"
+                        ))
+                    else:
+                        session.execute(text(self.get_shadow_index_def(index_def, name)))
+
+                session.execute(text(f"ANALYZE {SHADOW_TABLE}"))
+                session.commit()
+
+            self.swap_tables(
+                [(Events.__tablename__, PREVIOUS_TABLE), (SHADOW_TABLE, Events.__tablename__)],
+                [name for name, _, _ in indexes],
+                drop_previous=True,
+            )
+
+            seconds = time.perf_counter() - start
+            return {
+                "rows": loaded,
+                "seconds": seconds,
+                "rows_per_second": loaded / seconds if seconds > 0 else 0,
+            }
+        except Exception as e:
+            print(e)
+            raise e
+
+    def rollback_reload(self):
+        """Возвращает предыдущий снимок events, сохранённый последней перезагрузкой."""
+        try:
+            with self.sessionmaker() as session:
+                if session.scalar(text(f"SELECT to_regclass('{PREVIOUS_TABLE}')")) is None:
+                    raise Exception("Previous events table not found")
+
+                indexes = self.get_table_indexes(session, Events.__tablename__)
+                session.execute(text(f"DROP TABLE IF EXISTS {SHADOW_TABLE}"))
+                session.commit()
+
+            self.swap_tables(
+                [
+                    (Events.__tablename__, SHADOW_TABLE),
+                    (PREVIOUS_TABLE, Events.__tablename__),
+                    (SHADOW_TABLE, PREVIOUS_TABLE),
+                ],
+                [name for name, _, _ in indexes],
+            )
+        except Exception as e:
+            print(e)
+            raise e
+
+    def swap_tables(self, renames: list[tuple[str, str]], index_names: list[str], drop_previous: bool = False):
+        """
+        Переименовывает таблицы вместе с их индексами в одной транзакции.
+
+        Индексы live-таблицы events носят исходные имена, у теневой и предыдущей
+        таблиц имена выводятся из исходных, поэтому при любом обмене индексы
+        сохраняют имена, на которые рассчитывают миграции. Ожидание блокировки
+        ограничено SWAP_LOCK_TIMEOUT, чтобы переименование не останавливало
+        читателей надолго, при таймауте попытка повторяется.
+        """
+        index_name_getters = {
+            Events.__tablename__: lambda name: name,
+            SHADOW_TABLE: self.get_shadow_index_name,
+            PREVIOUS_TABLE: self.get_previous_index_name,
+        }
+
+        for attempt in range(1, SWAP_ATTEMPTS + 1):
+            try:
+                with self.sessionmaker() as session:
+                    session.execute(text(f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT}'"))
+                    if drop_previous:
+                        session.execute(text(f"DROP TABLE IF EXISTS {PREVIOUS_TABLE}"))
+
+                    for source, target in renames:
+                        session.execute(text(f"ALTER TABLE {source} RENAME TO {target}"))
+                        for name in index_names:
+                            session.execute(text(
+                                f"ALTER INDEX IF EXISTS {index_name_getters[source](name)} "
+                                f"RENAME TO {index_name_getters[target](name)}"
+                            ))
+
+                    session.commit()
+                    return
+            except OperationalError as e:
+                if attempt == SWAP_ATTEMPTS:
+                    raise e
+
+                logger.warning(f"Events tables swap attempt {attempt} failed: {e}")
+                time.sleep(attempt)
+
+    @staticmethod
+    def get_table_indexes(session, table_name: str) -> list[tuple[str, str, str | None]]:
+        """Возвращает имя, определение индекса и определение ограничения, если индекс его обслуживает."""
+        query = text(
+            "SELECT i.relname, pg_get_indexdef(i.oid), pg_get_constraintdef(c.oid) "
+            "FROM pg_index x "
+            "JOIN pg_class i ON i.oid = x.indexrelid "
+            "LEFT JOIN pg_constraint c ON c.conindid = x.indexrelid AND c.conrelid = x.indrelid "
+            "WHERE x.indrelid = CAST(:table_name AS regclass)"
+        )
+        return [tuple(row) for row in session.execute(query, {"table_name": table_name})]
+
+    @staticmethod
+    def get_shadow_index_name(name: str) -> str:
+        return f"{SHADOW_TABLE}_{hashlib.md5(name.encode()).hexdigest()[:12]}"
+
+    @staticmethod
+    def get_previous_index_name(name: str) -> str:
+        return f"{PREVIOUS_TABLE}_{hashlib.md5(name.encode()).hexdigest()[:12]}"
+
+    def get_shadow_index_def(self, index_def: str, name: str) -> str:
+        head, _, tail = index_def.partition(" ON ")
+        tail = tail.split(" ", 1)[1]
+        return f"{head.rsplit(' ', 1)[0]} {self.get_shadow_index_name(name)} ON {SHADOW_TABLE} {tail}"
+
+    @staticmethod
+    def copy_rows(
+            session,
+            table: Table,
+            columns: Iterable[str],
+            rows: Iterable[dict],
+            batch_size: int = BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        Пишет строки в таблицу пачками через COPY FROM STDIN в текущей транзакции сессии.
+
+        Если драйвер не поддерживает COPY (не psycopg2), пачки вставляются
+        многострочным INSERT через executemany.
+        """
+        columns = list(columns)
+        cursor = session.connection().connection.cursor()
+        use_copy = hasattr(cursor, "copy_expert")
+        copy_sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+
+        loaded = 0
+        rows = iter(rows)
+        try:
+            while batch := list(itertools.islice(rows, batch_size)):
+                if use_copy:
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+                    for row in batch:
+                        writer.writerow(
+                            json.dumps(row[column]) if isinstance(row[column], (list, dict)) else row[column]
+                            for column in columns
+                        )
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_sql, buffer)
+                else:
+                    session.execute(insert(table), batch)
+
+                loaded += len(batch)
+        finally:
+            cursor.close()
+
+        return loaded
+
+    def iter_sync_rows(self, events: Iterable[dict]):
+        """Отдаёт строки для загрузки в events, пропуская повторы event_id."""
+        seen = set()
+        for event in events:
+            row = self.get_sync_row(event)
+            if row["event_id"] in seen:
+                continue
+
+            seen.add(row["event_id"])
+            yield row
+
+    def get_sync_row(self, event: dict) -> dict:
+        row = {field: event.get(field) for field in SYNC_FIELDS}
+        row["event_id"] = int(event["event_id"])
+        row["content_hash"] = self.get_content_hash(row)
+        return row
+
+    @staticmethod
+    def get_content_hash(event: dict) -> str:
+        content = "\x1f".join(str(event.get(field)) for field in SYNC_FIELDS)
+        return hashlib.sha1(content.encode()).hexdigest()
+
+    def is_empty(self) -> bool:
+        try:
+            with self.sessionmaker() as session:
+                return session.scalar(select(Events.id).limit(1)) is None
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def is_empty_async(self) -> bool:
+        try:
+            async with self.async_sessionmaker() as session:
+                return await session.scalar(select(Events.id).limit(1)) is None
+        except Exception as e:
+            print(e)
+            raise e
+
     def drop_table(self):
         try:
             with self.sessionmaker() as session:
@@ -202,11 +706,14 @@ class Event:
 
         return res
 
+    @staticmethod
+    def get_sports_query() -> Select:
+        return select(Events.sport).distinct().order_by(Events.sport)
+
     def get_sports(self):
         try:
             with self.sessionmaker() as session:
-                query = select(Events.sport).distinct().order_by(Events.sport)
-                sports = session.scalars(query).all()
+                sports = session.scalars(self.get_sports_query()).all()
                 if sports is None:
                     raise Exception("Can't find sports")
                 return sports
@@ -214,21 +721,39 @@ class Event:
             print(e)
             raise e
 
+    async def get_sports_async(self) -> list[str]:
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.scalars(self.get_sports_query())).all()
+        except Exception as e:
+            print(e)
+            raise e
+
     def get_all_events_ids(self) -> list[int]:
         try:
             with self.sessionmaker() as session:
-                query = select(Events.event_id)
-                events_ids = session.scalars(query).all()
+                events_ids = session.scalars(select(Events.event_id)).all()
                 return events_ids
         except Exception as e:
             print(e)
             raise e
 
+    async def get_all_events_ids_async(self) -> list[int]:
+        try:
+            async with self.async_sessionmaker() as session:
+                return (await session.scalars(select(Events.event_id))).all()
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_by_event_id_query(event_id: int) -> Select:
+        return select(Events).filter_by(event_id=event_id)
+
     def get_by_event_id(self, event_id: int):
         try:
             with self.sessionmaker() as session:
-                query = select(Events).filter_by(event_id=event_id)
-                event = session.scalar(query)
+                event = session.scalar(self.get_by_event_id_query(event_id))
                 if event is None:
                     return None
 
@@ -237,20 +762,150 @@ class Event:
             print(e)
             raise e
 
-    def get_random_events(self, limit: int = 10) -> list[Events]:
+    @staticmethod
+    def get_many_by_event_ids_query(event_ids) -> Select:
+        return select(Events).where(Events.event_id.in_(event_ids))
+
+    def get_many_by_event_ids(self, event_ids) -> dict:
+        """
+        Загружает события по списку event_id одним запросом WHERE event_id IN (...).
+
+        Args:
+            event_ids: event_id событий; повторы, None и нечисловые значения пропускаются
+
+        Returns:
+            dict: найденные события по event_id в том виде, в каком он передан
+        """
+        ids = {}
+        for event_id in event_ids:
+            if event_id is None or event_id in ids:
+                continue
+
+            try:
+                ids[event_id] = int(event_id)
+            except (TypeError, ValueError):
+                continue
+
+        if not ids:
+            return {}
+
         try:
             with self.sessionmaker() as session:
-                query = select(Events).order_by(func.random()).limit(limit)
-                events: list[Events] = session.scalars(query).all()
+                events = {
+                    event.event_id: event
+                    for event in session.scalars(self.get_many_by_event_ids_query(set(ids.values())))
+                }
+        except Exception as e:
+            print(e)
+            raise e
+
+        return {event_id: events[id] for event_id, id in ids.items() if id in events}
+
+    async def get_by_event_id_async(self, event_id: int) -> Events | None:
+        try:
+            async with self.async_sessionmaker() as session:
+                return await session.scalar(self.get_by_event_id_query(event_id))
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_random_events_query(
+            limit: int,
+            sport: str | None = None,
+            upcoming: bool = False,
+            sample_keys: list[float] | None = None,
+    ) -> Select:
+        """
+        Случайная выборка событий без сортировки всей таблицы.
+
+        У каждой строки есть случайный sample_key. Для каждой из limit
+        случайных точек берётся первая строка с sample_key не меньше точки по
+        индексу ix_events_sample_key (ix_events_sport_sample_key при фильтре по
+        виду спорта), а если правее точки строк нет - первая строка с начала.
+        Точки независимы, поэтому выборка не состоит из соседних по sample_key
+        строк. Две точки могут попасть на одну строку, повторы убирает
+        get_unique_events. Цена запроса - limit коротких поисков по индексу.
+
+        Args:
+            limit (int): Размер выборки
+            sport (str | None): Только события этого вида спорта
+            upcoming (bool): Только события, которые ещё не начались
+            sample_keys (list[float] | None): Точки выборки в [0, 1), по умолчанию случайные
+        """
+        if sample_keys is None:
+            sample_keys = [random.random() for _ in range(limit)]
+
+        probes = (
+            values(column("n", Integer), column("key", Float), name="probes")
+            .data(list(enumerate(sample_keys)))
+        )
+
+        query = select(Events)
+        if sport is not None:
+            query = query.where(Events.sport == sport)
+        if upcoming:
+            query = query.where(Events.date_start >= datetime.now())
+
+        # Первая ветка - строка правее точки, вторая - переход через 1 к началу
+        candidates = union_all(
+            query.add_columns(literal(0).label("wrap"))
+            .where(Events.sample_key >= probes.c.key)
+            .order_by(Events.sample_key)
+            .limit(1)
+            .correlate(probes),
+            query.add_columns(literal(1).label("wrap")).order_by(Events.sample_key).limit(1),
+        ).subquery("candidates")
+        hit = select(candidates).order_by(candidates.c.wrap).limit(1).lateral("hit")
+
+        return (
+            select(aliased(Events, hit))
+            .select_from(probes)
+            .join(hit, true())
+            .order_by(probes.c.n)
+        )
+
+    @staticmethod
+    def get_unique_events(events: Iterable[Events]) -> list[Events]:
+        """Убирает повторы строк из случайной выборки, сохраняя порядок"""
+        return list({event.id: event for event in events}.values())
+
+    def get_random_events(self, limit: int = 10, sport: str | None = None, upcoming: bool = False) -> list[Events]:
+        try:
+            with self.sessionmaker() as session:
+                events: list[Events] = session.scalars(
+                    self.get_random_events_query(limit, sport, upcoming)
+                ).all()
 
                 if events is None:
                     raise Exception("Events table is empty")
 
-                return events
+                return self.get_unique_events(events)
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def get_random_events_async(
+            self,
+            limit: int = 10,
+            sport: str | None = None,
+            upcoming: bool = False,
+    ) -> list[Events]:
+        try:
+            async with self.async_sessionmaker() as session:
+                return self.get_unique_events(
+                    (await session.scalars(self.get_random_events_query(limit, sport, upcoming))).all()
+                )
         except Exception as e:
             print(e)
             raise e
 
+    @staticmethod
+    def get_events_by_date_query(selected_date, *columns) -> Select:
+        # date_start <= selected_date <= date_end через @> по GiST индексу date_range
+        query = select(*columns) if columns else select(Events)
+        return query.where(Events.date_range.contains(selected_date))
+
     def get_events_by_date(self, selected_date):
         """
         Получает все события, которые проходят в указанную дату
@@ -260,20 +915,79 @@ class Event:
             selected_date (datetime): Дата для фильтрации
 
         Returns:
-            list[Events]: Список событий, проходящих в указанную дату
+            list[Row]: Список событий (колонки EVENT_LIST_COLUMNS), проходящих в указанную дату
         """
         try:
             with self.sessionmaker() as session:
-                query = select(Events).where(
-                    and_(Events.date_start <= selected_date, Events.date_end >= selected_date)
-                )
-
-                events: list[Events] = session.scalars(query).all()
+                query = self.get_events_by_date_query(selected_date, *EVENT_LIST_COLUMNS)
+                events: list[Row] = session.execute(query).all()
                 return events
 
         except Exception as e:
             print(f"Error in get_events_by_date: {e}")
             return []
+
+    def get_events_by_date_page(
+            self,
+            selected_date,
+            limit: int = PAGE_DEFAULT_LIMIT,
+            cursor: str | None = None,
+            with_total: bool = False,
+    ) -> dict:
+        """Страница get_events_by_date в порядке (date_start, id), см. DB.pagination.get_page"""
+        try:
+            with self.sessionmaker() as session:
+                query = self.get_events_by_date_query(selected_date, *EVENT_LIST_COLUMNS)
+                return get_page(session, query, Events, limit, cursor, with_total, False)
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def get_events_by_date_async(self, selected_date) -> list[Row]:
+        try:
+            async with self.async_sessionmaker() as session:
+                query = self.get_events_by_date_query(selected_date, *EVENT_LIST_COLUMNS)
+                return (await session.execute(query)).all()
+        except Exception as e:
+            print(f"Error in get_events_by_date_async: {e}")
+            return []
+
+    def get_events_in_window_query(self, date_from: datetime, date_to: datetime, *columns) -> Select:
+        query = select(*columns) if columns else select(Events)
+        query = query.where(Events.date_range.overlaps(Range(date_from, date_to, bounds="[]")))
+        filters = self.get_filters()
+        if filters:
+            query = query.filter_by(**filters)
+
+        return query.order_by(Events.date_start)
+
+    def get_events_in_window(self, date_from: datetime, date_to: datetime) -> list[Events]:
+        """
+        Получает события, которые хотя бы одним днём попадают в окно дат
+        (date_start <= date_to и date_end >= date_from), например для месяца в календаре
+
+        Args:
+            date_from (datetime): Начало окна
+            date_to (datetime): Конец окна, включительно
+
+        Returns:
+            list[Row]: События окна (колонки EVENT_LIST_COLUMNS), отсортированные по date_start
+        """
+        try:
+            with self.sessionmaker() as session:
+                return session.execute(self.get_events_in_window_query(date_from, date_to, *EVENT_LIST_COLUMNS)).all()
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def get_events_in_window_async(self, date_from: datetime, date_to: datetime) -> list[Row]:
+        try:
+            async with self.async_sessionmaker() as session:
+                query = self.get_events_in_window_query(date_from, date_to, *EVENT_LIST_COLUMNS)
+                return (await session.execute(query)).all()
+        except Exception as e:
+            print(e)
+            raise e
         
     @staticmethod
     def event_to_dict(event) -> dict | None:
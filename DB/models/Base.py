@@ -19,5 +19,10 @@ class Base(DeclarativeBase):
         return f"<{self.__class__.__name__} {', '.join(cols)}>"
 
 
+# Период проведения [date_start, date_end] для генерируемой колонки date_range.
+# Для записи с перепутанными датами tsrange упал бы с ошибкой, поэтому там NULL
+DATE_RANGE_SQL = "CASE WHEN date_start <= date_end THEN tsrange(date_start, date_end, '[]') END"
+
+
 def get_datetime_UTC():
     return datetime.now(timezone.utc)
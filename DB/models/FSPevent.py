@@ -1,16 +1,25 @@
 import uuid
 from datetime import datetime
 
+from sqlalchemy import Index, Computed
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID, TEXT, JSONB
+from sqlalchemy.dialects.postgresql import UUID, TEXT, JSONB, TSRANGE, Range
 
-from DB.models.Base import Base, get_datetime_UTC
+from DB.models.Base import Base, get_datetime_UTC, DATE_RANGE_SQL
 from DB.models.enums.regions import Regions
 from DB.models.enums.FSPevent_status import FSPEventStatus
 
 
 class FSPEvents(Base):
     __tablename__ = "fsp_events"
+    __table_args__ = (
+        # FSPevent.get_by_filters: region, status, discipline и нижняя граница date_start
+        Index("ix_fsp_events_region_status_discipline_date_start", "region", "status", "discipline", "date_start"),
+        # FSPevent.get_by_filters с обеими датами: <@ по date_range
+        Index("ix_fsp_events_date_range", "date_range", postgresql_using="gist"),
+        # Постраничная выдача по курсору (date_start, id)
+        Index("ix_fsp_events_date_start_id", "date_start", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)
 
@@ -27,6 +36,10 @@ class FSPEvents(Base):
 
     date_start: Mapped[datetime] = mapped_column(nullable=False)
     date_end: Mapped[datetime] = mapped_column(nullable=False)
+    # Период проведения [date_start, date_end], вычисляется PostgreSQL
+    date_range: Mapped[Range[datetime]] = mapped_column(
+        TSRANGE, Computed(DATE_RANGE_SQL, persisted=True)
+    )
 
     status: Mapped[FSPEventStatus] = mapped_column(nullable=False)
     files: Mapped[list] = mapped_column(
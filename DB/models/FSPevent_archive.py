@@ -1,6 +1,7 @@
 from datetime import datetime
 import uuid
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import UUID, TEXT, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +11,10 @@ from DB.models.enums.FSPevent_status import FSPEventStatus
 
 class FSPevent_archive(Base):
     __tablename__ = "fsp_events_archive"
+    __table_args__ = (
+        # Постраничная выдача по курсору (date_start, id)
+        Index("ix_fsp_events_archive_date_start_id", "date_start", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,34 @@
+from enum import Enum
+from functools import cache
+
+
+@cache
+def get_enum_lookup(enum_class: type[Enum]) -> dict:
+    """
+    Словарь имя/значение -> член enum, строится один раз на класс.
+
+    Члены обходятся с конца, чтобы при совпадении имени одного члена со
+    значением другого побеждал объявленный раньше, как при переборе enum.
+    """
+    lookup = {}
+    for member in reversed(enum_class):
+        lookup[member.value] = member
+        lookup[member.name] = member
+
+    return lookup
+
+
+def to_enum(enum_class: type[Enum], key):
+    """
+    Приводит имя или значение к члену enum_class.
+
+    Члены enum возвращаются как есть, неизвестные ключи - без изменений.
+    """
+    if isinstance(key, Enum):
+        return key
+
+    try:
+        return get_enum_lookup(enum_class).get(key, key)
+    except TypeError:
+        # Нехешируемый ключ не может совпасть ни с именем, ни со значением
+        return key
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class NotificationCategories(Enum):
+    EVENT = "event"
+    CATEGORY = "category"
+    FSP = "FSP"
@@ -1,6 +1,7 @@
-from DB.models.Base import Base, get_datetime_UTC
+from DB.models.Base import Base, get_datetime_UTC, DATE_RANGE_SQL
+from sqlalchemy import Index, Computed, text
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID, BIGINT, JSONB
+from sqlalchemy.dialects.postgresql import UUID, BIGINT, JSONB, TSRANGE, DOUBLE_PRECISION, Range
 import uuid
 
 from datetime import datetime
@@ -8,6 +9,20 @@ from datetime import datetime
 
 class Events(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_event_id", "event_id", unique=True),
+        # Event.get_by_filters: sport, discipline и нижняя граница date_start
+        Index("ix_events_sport_discipline_date_start", "sport", "discipline", "date_start"),
+        # Event.get_events_by_date и Event.get_events_in_window: @> и && по date_range
+        Index("ix_events_date_range", "date_range", postgresql_using="gist"),
+        # Постраничная выдача по курсору (date_start, id)
+        Index("ix_events_date_start_id", "date_start", "id"),
+        # Event.get_random_events: поиск от случайных точек sample_key
+        Index("ix_events_sample_key", "sample_key"),
+        Index("ix_events_sport_sample_key", "sport", "sample_key"),
+        # Event.search: ILIKE '%...%' по названию
+        Index("ix_events_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
 
     repr_cols = ("name",)
 
@@ -30,8 +45,20 @@ class Events(Base):
 
     gender: Mapped[list] = mapped_column(JSONB, default=lambda: [])
 
+    # Хеш содержимого записи ЕКП, по нему синхронизация пропускает неизменённые строки
+    content_hash: Mapped[str] = mapped_column(nullable=True)
+
     date_start: Mapped[datetime] = mapped_column(nullable=False)
     date_end: Mapped[datetime] = mapped_column(nullable=False)
+    # Период проведения [date_start, date_end], вычисляется PostgreSQL
+    date_range: Mapped[Range[datetime]] = mapped_column(
+        TSRANGE, Computed(DATE_RANGE_SQL, persisted=True)
+    )
+
+    # Случайный ключ строки в [0, 1), задаётся PostgreSQL при вставке
+    sample_key: Mapped[float] = mapped_column(
+        DOUBLE_PRECISION, server_default=text("random()"), nullable=False
+    )
 
     created_at: Mapped[datetime] = mapped_column(default=get_datetime_UTC)
     updated_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Index, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from DB.models.Base import Base, get_datetime_UTC
+from DB.models.enums.notification_categories import NotificationCategories
+
+
+class Notifications(Base):
+    __tablename__ = "notifications"
+    __table_args__ = (
+        # check_upcoming_events: неотправленные уведомления с наступившим временем
+        Index("ix_notifications_sent_time", "notification_sent", "notification_time"),
+        # Подписки пользователя в порядке добавления
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        unique=True,
+        nullable=False,
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    event_category: Mapped[NotificationCategories] = mapped_column(nullable=False)
+    # id события ЕКП (event_id) или FSP события (id), для категории - NULL
+    event_id: Mapped[str] = mapped_column(nullable=True)
+    sport: Mapped[str] = mapped_column(nullable=True)
+    search_query: Mapped[str] = mapped_column(nullable=True)
+
+    notification_time: Mapped[datetime] = mapped_column(nullable=False)
+    notification_sent: Mapped[bool] = mapped_column(nullable=False, default=False)
+    # Время, когда отправитель забрал уведомление через Notification.claim
+    claimed_at: Mapped[datetime] = mapped_column(nullable=True)
+
+    email: Mapped[bool] = mapped_column(nullable=False, default=True)
+    telegram: Mapped[bool] = mapped_column(nullable=False, default=True)
+
+    created_at: Mapped[datetime] = mapped_column(default=get_datetime_UTC)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=get_datetime_UTC, onupdate=get_datetime_UTC
+    )
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -10,6 +11,10 @@ from DB.models.enums.token_types import TokenTypes
 
 class Token(Base):
     __tablename__ = "tokens"
+    __table_args__ = (
+        # Token.get / Token.delete: user_email, token_type и код из письма
+        Index("ix_tokens_user_email_token_type_token", "user_email", "token_type", "token"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -2,7 +2,7 @@ from DB.models.Base import Base, get_datetime_UTC
 from DB.models.enums.regions import Regions
 from DB.models.enums.user_roles import UserRoles
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID, BIGINT, JSONB
+from sqlalchemy.dialects.postgresql import UUID, BIGINT
 import uuid
 
 from datetime import datetime
@@ -33,8 +33,6 @@ class Users(Base):
     role: Mapped[UserRoles] = mapped_column(nullable=False, default=UserRoles.USER)
     region: Mapped[Regions] = mapped_column(nullable=True)
 
-    notifications: Mapped[list] = mapped_column(JSONB, nullable=True, default=lambda: [])
-
     created_at: Mapped[datetime] = mapped_column(default=get_datetime_UTC)
     updated_at: Mapped[datetime] = mapped_column(
         default=get_datetime_UTC, onupdate=get_datetime_UTC
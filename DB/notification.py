@@ -0,0 +1,339 @@
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from sqlalchemy import Select, select, update, delete, func, cast, or_, tuple_, String
+from sqlalchemy.orm import sessionmaker
+
+from DB.DataBase import SessionMaker
+from DB.models.notification import Notifications
+from DB.models.enums.notification_categories import NotificationCategories
+from DB.models.enums.lookup import to_enum
+
+# Сколько забранное уведомление недоступно другим отправителям: если за это
+# время обработчик не вызвал mark_sent, уведомление снова заберёт check_upcoming_events
+CLAIM_LEASE = timedelta(minutes=15)
+
+
+class Notification:
+    __slots__ = (
+        "id",
+        "user_id",
+        "event_category",
+        "event_id",
+        "sport",
+        "search_query",
+        "notification_time",
+        "notification_sent",
+        "email",
+        "telegram",
+        "claimed_at",
+        "created_at",
+    )
+
+    def __init__(
+            self,
+            id: str | None = None,
+            user_id: str | None = None,
+            event_category: NotificationCategories | None = None,
+            event_id: str | None = None,
+            sport: str | None = None,
+            search_query: str | None = None,
+            notification_time: datetime | None = None,
+            notification_sent: bool = False,
+            email: bool = True,
+            telegram: bool = True,
+    ):
+        self.id: str | None = id
+        self.user_id: str | None = user_id
+
+        self.event_category: NotificationCategories | None = event_category
+        self.event_id: str | None = str(event_id) if event_id is not None else None
+        self.sport: str | None = sport
+        self.search_query: str | None = search_query
+
+        self.notification_time: datetime | None = notification_time
+        self.notification_sent: bool = notification_sent
+
+        self.email: bool = email
+        self.telegram: bool = telegram
+
+        self.claimed_at: datetime | None = None
+        self.created_at: datetime | None = None
+
+        self.convert_category_to_key()
+
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
+    def add(self) -> bool:
+        try:
+            with self.sessionmaker() as session:
+                notification = Notifications(user_id=self.user_id, **self.get_self())
+                session.add(notification)
+                session.flush()
+                self.id = str(notification.id)
+                self.created_at = notification.created_at
+                session.commit()
+                return True
+        except Exception as e:
+            print(e)
+            return False
+
+    def get_by_filters(self) -> list["Notification"]:
+        """Уведомления по user_id, event_id и event_category в порядке добавления"""
+        try:
+            with self.sessionmaker() as session:
+                notifications = session.scalars(self.get_by_filters_query()).all()
+                return self.get_from_models(notifications)
+        except Exception as e:
+            print(e)
+            raise e
+
+    def get_by_filters_query(self) -> Select:
+        return (
+            select(Notifications)
+            .filter_by(**self.get_filter_by())
+            .order_by(Notifications.created_at, Notifications.id)
+        )
+
+    def update(self, data: dict) -> bool:
+        try:
+            self.check_update(data)
+            values = self.get_self()
+            if data.get("notification_time") is not None:
+                # Перенос снимает аренду: идущая отправка старого времени
+                # не отметит уведомление отправленным (см. mark_sent)
+                values["claimed_at"] = None
+
+            with self.sessionmaker() as session:
+                query = update(Notifications).filter_by(id=self.id).values(**values)
+                session.execute(query)
+                session.commit()
+                return True
+        except Exception as e:
+            print(e)
+            return False
+
+    def delete(self) -> bool:
+        """Удаляет уведомления по id или по user_id и event_id"""
+        try:
+            filters = self.get_filter_by()
+            if not filters:
+                raise ValueError("Notification filters are required for deleting")
+
+            with self.sessionmaker() as session:
+                session.execute(delete(Notifications).filter_by(**filters))
+                session.commit()
+                return True
+        except Exception as e:
+            print(e)
+            return False
+
+    def iter_due(self, until: datetime, batch_size: int) -> Iterator[list["Notification"]]:
+        """
+        Неотправленные уведомления со временем не позже until пачками по batch_size.
+
+        Запрос читает только диапазон (false, ..until] индекса
+        ix_notifications_sent_time, строки идут серверным курсором (yield_per),
+        в памяти держится только текущая пачка.
+        """
+        try:
+            with self.sessionmaker() as session:
+                query = self.get_due_query(until).execution_options(yield_per=batch_size)
+                for notifications in session.scalars(query).partitions():
+                    yield self.get_from_models(notifications)
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_due_query(until: datetime) -> Select:
+        return (
+            select(Notifications)
+            .where(
+                Notifications.notification_sent.is_(False),
+                Notifications.notification_time <= until,
+            )
+            .order_by(Notifications.notification_time)
+        )
+
+    def claim(self, ids: list[str]) -> list["Notification"]:
+        """
+        Забирает неотправленные уведомления из ids и возвращает их.
+
+        Уведомление получает claimed_at в том же UPDATE, что проверяет
+        notification_sent = false и отсутствие действующей аренды, поэтому
+        каждое уведомление получит только один из конкурирующих отправителей
+        (очередь Redis и check_upcoming_events). Отправленным его отмечает
+        mark_sent после постановки задач отправки, а если обработчик упал
+        раньше, после CLAIM_LEASE уведомление можно забрать снова.
+        """
+        if not ids:
+            return []
+
+        return self.claim_where(Notifications.id.in_(ids))
+
+    def claim_due(self, until: datetime, shard: int = 0, shards: int = 1) -> list["Notification"]:
+        """
+        Как claim, но для всех неотправленных уведомлений со временем не позже until.
+
+        При shards > 1 забираются только уведомления пользователей шарда shard,
+        так что шарды можно обрабатывать параллельно.
+        """
+        where = [Notifications.notification_time <= until]
+        if shards > 1:
+            where.append(self.get_shard_clause(shard, shards))
+
+        return self.claim_where(*where)
+
+    def claim_where(self, *where) -> list["Notification"]:
+        try:
+            now = datetime.now()
+            with self.sessionmaker() as session:
+                query = (
+                    update(Notifications)
+                    .where(
+                        Notifications.notification_sent.is_(False),
+                        or_(Notifications.claimed_at.is_(None), Notifications.claimed_at < now - CLAIM_LEASE),
+                        *where,
+                    )
+                    .values(claimed_at=now)
+                    .returning(Notifications)
+                    .execution_options(synchronize_session=False)
+                )
+                notifications = session.scalars(query).all()
+                session.commit()
+                return self.get_from_models(notifications)
+        except Exception as e:
+            print(e)
+            raise e
+
+    def mark_sent(self, notifications: list["Notification"]) -> int:
+        """
+        Отмечает забранные уведомления отправленными.
+
+        Отмечаются только строки, аренда которых не менялась с claim: если
+        уведомление перенесли или забрали заново, оно остаётся неотправленным.
+        """
+        claims = [
+            (notification.id, notification.claimed_at)
+            for notification in notifications
+            if notification.claimed_at is not None
+        ]
+        if not claims:
+            return 0
+
+        try:
+            with self.sessionmaker() as session:
+                query = (
+                    update(Notifications)
+                    .where(tuple_(Notifications.id, Notifications.claimed_at).in_(claims))
+                    .values(notification_sent=True, claimed_at=None)
+                    .execution_options(synchronize_session=False)
+                )
+                count = session.execute(query).rowcount
+                session.commit()
+                return count
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_shard_clause(shard: int, shards: int):
+        """Условие принадлежности уведомления шарду по хешу user_id"""
+        user_hash = func.hashtext(cast(Notifications.user_id, String)).op("&")(0x7FFFFFFF)
+        return user_hash % shards == shard
+
+    def delete_by_ids(self, ids: list[str]) -> int:
+        if not ids:
+            return 0
+
+        try:
+            with self.sessionmaker() as session:
+                query = (
+                    delete(Notifications)
+                    .where(Notifications.id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+                count = session.execute(query).rowcount
+                session.commit()
+                return count
+        except Exception as e:
+            print(e)
+            raise e
+
+    def check_update(self, data: dict):
+        if data.get("notification_time") is not None:
+            self.notification_time = data["notification_time"]
+
+        if data.get("notification_sent") is not None:
+            self.notification_sent = data["notification_sent"]
+
+        if data.get("email") is not None:
+            self.email = data["email"]
+
+        if data.get("telegram") is not None:
+            self.telegram = data["telegram"]
+
+    def convert_category_to_key(self):
+        self.event_category = to_enum(NotificationCategories, self.event_category)
+
+    def get_from_model(self, model: Notifications):
+        self.id = str(model.id)
+        self.user_id = str(model.user_id)
+        self.event_category = model.event_category
+        self.event_id = model.event_id
+        self.sport = model.sport
+        self.search_query = model.search_query
+        self.notification_time = model.notification_time
+        self.notification_sent = model.notification_sent
+        self.email = model.email
+        self.telegram = model.telegram
+        self.claimed_at = model.claimed_at
+        self.created_at = model.created_at
+
+    @staticmethod
+    def get_from_models(notifications: list[Notifications]) -> list["Notification"]:
+        res = []
+        for notification in notifications:
+            temp_notification = Notification()
+            temp_notification.get_from_model(notification)
+            res.append(temp_notification)
+
+        return res
+
+    def get_filter_by(self) -> dict:
+        res = {}
+        if self.id is not None:
+            res["id"] = self.id
+
+        if self.user_id is not None:
+            res["user_id"] = self.user_id
+
+        if self.event_id is not None:
+            res["event_id"] = self.event_id
+
+        if self.event_category is not None:
+            res["event_category"] = self.event_category
+
+        return res
+
+    def get_self(self) -> dict:
+        return {
+            "event_category": self.event_category,
+            "event_id": self.event_id,
+            "sport": self.sport,
+            "search_query": self.search_query,
+            "notification_time": self.notification_time,
+            "notification_sent": self.notification_sent,
+            "email": self.email,
+            "telegram": self.telegram,
+        }
+
+    def get_self_response(self) -> dict:
+        data = self.get_self()
+        data["id"] = self.id
+        data["event_category"] = self.event_category.value if self.event_category is not None else None
+        data["notification_time"] = self.notification_time.isoformat() if self.notification_time else None
+        return data
@@ -0,0 +1,99 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Select, select, func, tuple_
+
+PAGE_DEFAULT_LIMIT = 100
+PAGE_MAX_LIMIT = 500
+
+
+def encode_cursor(date_start: datetime, id) -> str:
+    """Непрозрачный курсор на позицию после строки (date_start, id)"""
+    data = json.dumps([date_start.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Разбирает курсор из encode_cursor.
+
+    Raises:
+        ValueError: Курсор повреждён или создан не encode_cursor
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date_start, id = json.loads(data)
+        return datetime.fromisoformat(date_start), uuid.UUID(id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def get_page_limit(limit) -> int:
+    """
+    Приводит limit из запроса к числу в [1, PAGE_MAX_LIMIT].
+
+    Raises:
+        ValueError: limit не число или меньше 1
+    """
+    if limit is None or limit == "":
+        return PAGE_DEFAULT_LIMIT
+
+    limit = int(limit)
+    if limit < 1:
+        raise ValueError("limit must be positive")
+
+    return min(limit, PAGE_MAX_LIMIT)
+
+
+def get_page(
+        session,
+        query: Select,
+        model,
+        limit: int,
+        cursor: str | None = None,
+        with_total: bool = False,
+        scalars: bool = True,
+) -> dict:
+    """
+    Выбирает страницу запроса в порядке (date_start, id) по курсору.
+
+    Следующая страница начинается строго после последней строки текущей,
+    поэтому цена запроса не зависит от номера страницы.
+
+    Args:
+        session: Сессия SQLAlchemy
+        query (Select): Запрос обёртки без сортировки и limit
+        model: Модель с колонками date_start и id
+        limit (int): Размер страницы
+        cursor (str | None): next_cursor предыдущей страницы
+        with_total (bool): Посчитать общее количество строк запроса
+        scalars (bool): Запрос выбирает модель целиком; для запросов по колонкам
+            (в них должны быть date_start и id) страница состоит из Row
+
+    Returns:
+        dict: items - модели или Row страницы, next_cursor - курсор следующей страницы
+            или None, total - количество строк или None
+    """
+    total = None
+    if with_total:
+        total = session.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+    page_query = query.order_by(None).order_by(model.date_start, model.id)
+    if cursor:
+        date_start, id = decode_cursor(cursor)
+        page_query = page_query.where(tuple_(model.date_start, model.id) > tuple_(date_start, id))
+
+    result = session.execute(page_query.limit(limit + 1))
+    items = result.scalars().all() if scalars else result.all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].date_start, items[-1].id)
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "total": total,
+    }
@@ -1,16 +1,25 @@
-from sqlalchemy import select, delete
+from sqlalchemy import Select, select, delete
 from sqlalchemy.orm import sessionmaker
 
 from datetime import datetime, timedelta
-from enum import Enum
 import random
 
 from DB.DataBase import SessionMaker
 from DB.models.token import Token as Token_model
 from DB.models.enums.token_types import TokenTypes
+from DB.models.enums.lookup import to_enum
 
 
 class Token:
+    __slots__ = (
+        "id",
+        "token",
+        "token_type",
+        "user_email",
+        "created_at",
+        "expires_at",
+    )
+
     def __init__(
             self,
             id: str | None = None,
@@ -20,8 +29,6 @@ class Token:
             created_at: datetime | None = None,
             expires_at: datetime | None = None
     ):
-        self.sessionmaker: sessionmaker = SessionMaker().session_factory
-
         self.id: str | None = id
 
         self.token: int | None = token
@@ -33,6 +40,10 @@ class Token:
 
         self.get_token_type()
 
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
     def add(self) -> bool:
         try:
             with self.sessionmaker() as session:
@@ -57,8 +68,7 @@ class Token:
     def get(self) -> bool:
         try:
             with self.sessionmaker() as session:
-                query = select(Token_model).filter_by(**self.get_filter_by())
-                token = session.execute(query).scalars().first()
+                token = session.execute(self.get_query()).scalars().first()
                 if token is None:
                     return None
 
@@ -73,6 +83,9 @@ class Token:
             print(f"Error getting token: {e}")
             return False
 
+    def get_query(self) -> Select:
+        return select(Token_model).filter_by(**self.get_filter_by())
+
     def delete(self) -> bool:
         try:
             with self.sessionmaker() as session:
@@ -85,13 +98,7 @@ class Token:
             return False
 
     def get_token_type(self) -> None:
-        if isinstance(self.token_type, Enum):
-            return
-
-        for token_type in TokenTypes:
-            if token_type.name == self.token_type or token_type.value == self.token_type:
-                self.token_type = token_type
-                return
+        self.token_type = to_enum(TokenTypes, self.token_type)
 
     def get_filter_by(self) -> dict:
         res = {}
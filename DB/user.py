@@ -1,28 +1,43 @@
 from datetime import datetime, timedelta, timezone
-import uuid
 import jwt
-import json
 import os
 import random
 import string
-from enum import Enum
 from dotenv import load_dotenv
 
 from werkzeug.security import generate_password_hash
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from DB.DataBase import SessionMaker
+from DB.DataBase import SessionMaker, AsyncSessionMaker
+from DB.uuids import get_uuids
 
 from DB.models.user import Users
 from DB.models.enums.user_roles import UserRoles
 from DB.models.enums.regions import Regions
+from DB.models.enums.lookup import to_enum
 
 load_dotenv()
 
 
 class User:
+    __slots__ = (
+        "id",
+        "is_verified",
+        "name",
+        "email",
+        "password",
+        "tg_id",
+        "username",
+        "region",
+        "role",
+        "auto_add",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             id: str | None = None,
@@ -34,11 +49,8 @@ class User:
             username: str = None,
             region: Regions | None = None,
             role: UserRoles | None = None,
-            notifications: list[dict] = None,
             auto_add: bool = False,
     ):
-        self.sessionmaker: sessionmaker = SessionMaker().session_factory
-
         self.id: str | None = id
         self.is_verified: bool = is_verified
 
@@ -49,8 +61,6 @@ class User:
         self.tg_id: int = int(tg_id) if tg_id is not None else None
         self.username: str = username
 
-        self.notifications: list = notifications if notifications is not None else []
-
         self.region: Regions | None = region
         self.role: UserRoles | None = role
 
@@ -65,11 +75,34 @@ class User:
         if self.auto_add and self.get() is None:
             self.add()
 
+    @property
+    def sessionmaker(self) -> sessionmaker:
+        return SessionMaker().session_factory
+
+    @property
+    def async_sessionmaker(self) -> async_sessionmaker:
+        return AsyncSessionMaker().session_factory
+
     def get(self):
         try:
             with self.sessionmaker() as session:
-                query = select(Users).filter_by(**self.get_filter_by())
-                user: Users = session.scalar(query)
+                user: Users = session.scalar(self.get_query())
+                if user is None:
+                    return
+
+                self.get_from_model(user)
+                self.convert_region_to_key()
+                self.convert_role_to_key()
+
+                return self
+        except Exception as e:
+            print(e)
+            raise e
+
+    async def get_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                user: Users = await session.scalar(self.get_query())
                 if user is None:
                     return
 
@@ -82,30 +115,48 @@ class User:
             print(e)
             raise e
 
+    def get_query(self) -> Select:
+        return select(Users).filter_by(**self.get_filter_by())
+
     def get_by_role(self, role: UserRoles):
         try:
             with self.sessionmaker() as session:
-                query = select(Users).filter_by(role=role)
-                users = session.scalars(query).all()
+                users = session.scalars(self.get_by_role_query(role)).all()
                 if users is None:
                     return []
 
-                res = []
-                for user in users:
-                    temp_user = User()
-                    temp_user.get_from_model(user)
-                    res.append(temp_user)
+                return self.get_from_models(users)
+        except Exception as e:
+            print(e)
+            raise e
 
-                return res
+    async def get_by_role_async(self, role: UserRoles):
+        try:
+            async with self.async_sessionmaker() as session:
+                users = (await session.scalars(self.get_by_role_query(role))).all()
+                return self.get_from_models(users)
         except Exception as e:
             print(e)
             raise e
 
+    @staticmethod
+    def get_by_role_query(role: UserRoles) -> Select:
+        return select(Users).filter_by(role=role)
+
+    @staticmethod
+    def get_from_models(users: list[Users]) -> list["User"]:
+        res = []
+        for user in users:
+            temp_user = User()
+            temp_user.get_from_model(user)
+            res.append(temp_user)
+
+        return res
+
     def get_by_region(self, region: Regions):
         try:
             with self.sessionmaker() as session:
-                query = select(Users).filter_by(region=region.name)
-                users = session.scalars(query).first()
+                users = session.scalars(self.get_by_region_query(region)).first()
                 if users is None:
                     return None
 
@@ -117,6 +168,52 @@ class User:
         except Exception as e:
             print(e)
             raise e
+
+    async def get_by_region_async(self, region: Regions):
+        try:
+            async with self.async_sessionmaker() as session:
+                users = (await session.scalars(self.get_by_region_query(region))).first()
+                if users is None:
+                    return None
+
+                self.get_from_model(users)
+                self.convert_region_to_key()
+                self.convert_role_to_key()
+
+                return self
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_by_region_query(region: Regions) -> Select:
+        return select(Users).filter_by(region=region.name)
+
+    def get_many(self, ids) -> dict[str, "User"]:
+        """
+        Загружает пользователей по списку id одним запросом WHERE id IN (...).
+
+        Args:
+            ids: id пользователей; повторы и значения, не являющиеся UUID, пропускаются
+
+        Returns:
+            dict[str, User]: найденные пользователи по строковому id
+        """
+        ids = set(get_uuids(ids).values())
+        if not ids:
+            return {}
+
+        try:
+            with self.sessionmaker() as session:
+                users = session.scalars(self.get_many_query(ids)).all()
+                return {user.id: user for user in self.get_from_models(users)}
+        except Exception as e:
+            print(e)
+            raise e
+
+    @staticmethod
+    def get_many_query(ids) -> Select:
+        return select(Users).where(Users.id.in_(ids))
         
     def get_self_response(self, token: str = None):
         data = self.get_self()
@@ -159,15 +256,6 @@ class User:
             self.region = data["region"]
             self.convert_region_to_key()
 
-        if data.get("notifications") is not None:
-            if isinstance(data["notifications"], list):
-                self.notifications = data["notifications"]
-            else:
-                try:
-                    self.notifications = json.loads(data["notifications"])
-                except:
-                    raise ValueError("Notifications must be a list or a valid JSON string")
-
     def add(self):
         try:
             with self.sessionmaker() as session:
@@ -182,6 +270,20 @@ class User:
             print(e)
             raise e
 
+    async def add_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                user: Users = Users(**self.get_self())
+                session.add(user)
+                await session.flush()
+                self.id = str(user.id)
+                await session.commit()
+                return self
+
+        except Exception as e:
+            print(e)
+            raise e
+
     def get_from_model(self, model: Users):
         self.id = str(model.id)
         self.is_verified = model.is_verified
@@ -192,45 +294,20 @@ class User:
         self.username = model.username
         self.region = model.region
         self.role = model.role
-        self.notifications = model.notifications
         self.created_at = model.created_at
         self.updated_at = model.updated_at
 
     def convert_region_to_key(self):
-        if isinstance(self.region, Enum):
-            return
-
-        for reg in Regions:
-            if reg.value == self.region or reg.name == self.region:
-                self.region = reg
-                return
+        self.region = to_enum(Regions, self.region)
 
     def convert_role_to_key(self):
-        if isinstance(self.role, Enum):
-            return
-
-        for role in UserRoles:
-            if role.value == self.role or role.name == self.role:
-                self.role = role
-                return
+        self.role = to_enum(UserRoles, self.role)
 
     def add_fsp_admin(self):
         try:
-            role = UserRoles.REGIONAL_ADMIN
-            if self.region.name == Regions.MOSCOW.name:
-                role = UserRoles.CENTRAL_ADMIN
-
             with self.sessionmaker() as session:
                 password = self.gen_password()
-                fsp_admin = Users(
-                    email=self.email,
-                    region=self.region.name,
-                    name=self.name,
-                    password=self.password,
-                    role=role,
-                    is_verified=True,
-                )
-                session.add(fsp_admin)
+                session.add(self.get_fsp_admin_model())
                 session.commit()
 
                 return password
@@ -238,6 +315,32 @@ class User:
             print(f"Error adding FSP admin: {e}")
             return None
 
+    async def add_fsp_admin_async(self):
+        try:
+            async with self.async_sessionmaker() as session:
+                password = self.gen_password()
+                session.add(self.get_fsp_admin_model())
+                await session.commit()
+
+                return password
+        except Exception as e:
+            print(f"Error adding FSP admin: {e}")
+            return None
+
+    def get_fsp_admin_model(self) -> Users:
+        role = UserRoles.REGIONAL_ADMIN
+        if self.region.name == Regions.MOSCOW.name:
+            role = UserRoles.CENTRAL_ADMIN
+
+        return Users(
+            email=self.email,
+            region=self.region.name,
+            name=self.name,
+            password=self.password,
+            role=role,
+            is_verified=True,
+        )
+
     def update(self, data: dict) -> bool:
         try:
             self.check_update(data)
@@ -264,49 +367,6 @@ class User:
             print(e)
             return False
 
-    def add_notification(self, sport: str, search: str) -> list[dict]:
-        try:
-            with self.sessionmaker() as session:
-                user = session.query(Users).filter_by(**self.get_filter_by()).first()
-                if not user:
-                    raise ValueError("User not found")
-
-                current_notifications = user.notifications or []
-
-                new_notification = {
-                    "id": str(uuid.uuid4()),
-                    "sport": sport,
-                    "search": search
-                }
-
-                new_notifications = current_notifications + [new_notification]
-
-                session.query(Users).filter_by(**self.get_filter_by()).update({
-                    "notifications": new_notifications
-                }, synchronize_session=False)
-
-                session.commit()
-
-                self.notifications = new_notifications
-
-                return new_notifications
-
-        except Exception as e:
-            print(f"Error adding notification: {e}")
-            raise e
-
-    def get_notifications(self):
-        try:
-            with self.sessionmaker() as session:
-                user = session.query(Users).filter_by(**self.get_filter_by()).first()
-                if not user:
-                    raise ValueError("User not found")
-
-                return user.notifications
-        except Exception as e:
-            print(f"Error getting notifications: {e}")
-            raise e
-
     def get_filter_by(self) -> dict:
         res = {}
         if self.id is not None:
@@ -328,7 +388,6 @@ class User:
             "password": self.password,
             "tg_id": self.tg_id,
             "username": self.username,
-            "notifications": self.notifications if isinstance(self.notifications, list) else [],
             "region": self.region.name if self.region is not None else None,
             "role": self.role.name if self.role is not None else None,
         }
@@ -358,52 +417,6 @@ class User:
         )
         return token
 
-    def remove_notification(self, notification_id: str):
-        try:
-            with self.sessionmaker() as session:
-                user = session.query(Users).filter_by(**self.get_filter_by()).first()
-                if not user:
-                    raise ValueError("User not found")
-
-                current_notifications = user.notifications or []
-
-                new_notifications = [
-                    notif for notif in current_notifications
-                    if notif.get('id') != notification_id
-                ]
-
-                if len(current_notifications) == len(new_notifications):
-                    raise ValueError(f"Notification with id {notification_id} not found")
-
-                session.query(Users).filter_by(**self.get_filter_by()).update({
-                    "notifications": new_notifications
-                }, synchronize_session=False)
-
-                session.commit()
-
-                self.notifications = new_notifications
-
-                return True
-
-        except Exception as e:
-            print(f"Error removing notification: {e}")
-            raise e
-
-    def get_users_with_notifications(self):
-        try:
-            with self.sessionmaker() as session:
-                query = select(Users).filter(
-                    Users.notifications.is_not(None),
-                    func.jsonb_array_length(Users.notifications) > 0
-                )
-                users = session.scalars(query).all()
-                if users is None:
-                    raise Exception("Users not found")
-                return users
-        except Exception as e:
-            print(f"Error getting users with notifications: {e}")
-            raise e
-
 
 if __name__ == "__main__":
     user_manager: User = User(auto_add=False)
@@ -0,0 +1,22 @@
+import uuid
+
+
+def get_uuids(ids) -> dict:
+    """
+    Приводит id к UUID для запросов WHERE id IN (...).
+
+    Значения, не являющиеся UUID, пропускаются: они не могут совпасть с
+    колонкой UUID, а PostgreSQL отклонил бы из-за них весь запрос.
+
+    Returns:
+        dict: исходный id -> UUID в порядке первых вхождений
+    """
+    res = {}
+    for id in ids:
+        try:
+            if id is not None and id not in res:
+                res[id] = id if isinstance(id, uuid.UUID) else uuid.UUID(str(id))
+        except (TypeError, ValueError):
+            continue
+
+    return res
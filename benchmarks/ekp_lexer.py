@@ -0,0 +1,126 @@
+"""
+Сравнение разбора текста ЕКП: прежний конвейер из extract_pdf_to_table
+против однопроходного лексера parsing.fn.iter_sport_records.
+
+Запуск:
+    python -m benchmarks.ekp_lexer --pages 2495
+"""
+import argparse
+import datetime
+import re
+import time
+
+from benchmarks.synthetic import generate_pages
+from parsing.fn import iter_sport_records, parse_event_record
+
+
+def legacy_parse(pages: list[str]) -> list[dict]:
+    """Прежний разбор из extract_pdf_to_table (без отладочного print)."""
+    all_text = ""
+    for page in pages:
+        all_text += page
+
+    for i in range(1, len(pages) + 1):
+        all_text = all_text.replace(f"Стр. {i} из {len(pages)}", "", 1)
+
+    table = {}
+    sport_pattern = r"([А-ЯЁ\s\(\)-]+)\nОсновной состав"
+    split_text_by_sport = re.split(sport_pattern, all_text)
+    matches = re.finditer(sport_pattern, all_text)
+    i = 1
+    for match in matches:
+        sport_name = match.group(1)
+        table[sport_name.strip(")").replace("\n", "")] = split_text_by_sport[i * 2].replace("\n", " ").replace("Молодежный (резервный) состав", "")
+        i += 1
+
+    for sport, text in table.copy().items():
+        split_by_number = re.split(r"(\b[0-9]{16}\b)", text)
+        even = split_by_number[::2]
+        odd = split_by_number[1::2]
+        result = {}
+        for x, y in zip(even[1:], odd):
+            if len(x) == 16:
+                result[x] = y.strip()
+            else:
+                result[y] = x.strip()
+        table[sport] = result
+
+    events_list = []
+    for sport, events in table.items():
+        for number, text in events.items():
+            pattern = re.compile(r'[0-9.]{10} [0-9.]{10}')
+            dates = [match.group(0).strip() for match in pattern.finditer(text) if match.group(0).strip()][-1]
+            text = text.split(dates)
+            dates = dates.split(" ")
+
+            pattern = re.compile(r'(\d{1,5}$)')
+            participants_num = [match.group(0).strip() for match in pattern.finditer("".join(text)) if match.group(0).strip()][-1]
+            text[1] = text[1][:-len(participants_num)]
+
+            pattern = re.compile(r'([а-яё]+[а-яё0-9, \-]*[а-яё][а-яё0-9, \-]*)')
+            participants = [match.group(0).strip() for match in pattern.finditer("".join(text[0])) if match.group(0).strip()][0]
+            place = text[1].strip().replace("\n", " ").replace("  ", " ")
+            text = text[0].split(participants)
+
+            events_list.append({
+                "event_id": number,
+                "title": text[0].strip(),
+                "participants": participants,
+                "participants_num": participants_num,
+                "discipline": text[1].strip(),
+                "place": place,
+                "date_start": datetime.datetime.strptime(dates[0], "%d.%m.%Y"),
+                "date_end": datetime.datetime.strptime(dates[1], "%d.%m.%Y"),
+                "sport": sport,
+            })
+
+    return events_list
+
+
+def lexer_parse(pages: list[str]) -> list[dict]:
+    events_list = []
+    for sport, number, text in iter_sport_records(pages):
+        event = parse_event_record(number, text)
+        if event is not None:
+            event["sport"] = sport
+            events_list.append(event)
+
+    return events_list
+
+
+def measure(func, pages: list[str], repeat: int) -> tuple[float, list[dict]]:
+    best = float("inf")
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(pages)
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=2495)
+    parser.add_argument("--records-per-page", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = generate_pages(args.pages, args.records_per_page)
+    size = sum(len(page) for page in pages)
+    print(f"Документ: {args.pages} страниц, {size / 1_000_000:.1f} млн символов")
+
+    legacy_time, legacy_events = measure(legacy_parse, pages, args.repeat)
+    lexer_time, lexer_events = measure(lexer_parse, pages, args.repeat)
+
+    if legacy_events != lexer_events:
+        raise SystemExit("Результаты разбора не совпадают")
+
+    print(f"Записей: {len(lexer_events)}")
+    print(f"Прежний разбор: {legacy_time:.3f} с")
+    print(f"Лексер:         {lexer_time:.3f} с")
+    print(f"Ускорение:      {legacy_time / lexer_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
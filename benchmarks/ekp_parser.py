@@ -0,0 +1,125 @@
+"""
+Замер стадий разбора ЕКП на синтетических PDF без доступа к сети.
+
+Для каждого размера документа генерируется PDF в раскладке ЕКП, после чего
+отдельно замеряются стадии парсера: извлечение текста PyPDF2 (последовательно
+и в пуле процессов), лексер iter_sport_records, разбор записей
+parse_event_record, сквозной iter_pdf_events и кеш разобранных событий.
+
+Время замеряется без tracemalloc (лучшее из --repeat запусков), пиковая
+память - отдельным запуском под tracemalloc. Для пула процессов учитывается
+только память родительского процесса.
+
+Запуск:
+    python -m benchmarks.ekp_parser --pages 100 1000 5000 --workers 4
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.pdf import write_pdf
+from benchmarks.synthetic import generate_pages
+from parsing import fn
+
+
+def measure(func, repeat: int) -> tuple[float, int, object]:
+    """Возвращает лучшее время, пик памяти под tracemalloc и результат функции."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    # Результат замера времени держим до конца, чтобы он не попал в пик следующего запуска
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak, result
+
+
+def get_stages(file_path: str, workers: int, chunk_pages: int) -> list[tuple]:
+    """Стадии в порядке конвейера: каждая получает на вход результат предыдущих."""
+    stages = []
+    state = {}
+
+    def extract():
+        state["pages"] = list(fn.iter_pdf_pages(file_path))
+        return state["pages"]
+
+    def lex():
+        state["records"] = list(fn.iter_sport_records(state["pages"]))
+        return state["records"]
+
+    def parse():
+        state["events"] = [fn.parse_event_record(number, text) for _, number, text in state["records"]]
+        return state["events"]
+
+    def pipeline():
+        return list(fn.iter_pdf_events(file_path, workers, chunk_pages))
+
+    def cache_save():
+        columns = fn.get_cache_columns()
+        for (sport, _, _), event in zip(state["records"], state["events"]):
+            fn.add_cached_event(columns, dict(event, sport=sport))
+        fn.save_cached_events("benchmark", columns)
+
+    def cache_load():
+        return list(fn.iter_cached_events(fn.load_cached_events("benchmark")))
+
+    stages.append(("Извлечение текста", extract))
+    if workers > 1:
+        stages.append((
+            f"Извлечение текста, workers={workers}",
+            lambda: list(fn.iter_pdf_pages_parallel(file_path, workers, chunk_pages)),
+        ))
+    stages.append(("Лексер", lex))
+    stages.append(("Разбор записей", parse))
+    stages.append((f"Сквозной разбор, workers={workers}", pipeline))
+    stages.append(("Запись кеша", cache_save))
+    stages.append(("Чтение кеша", cache_load))
+    return stages
+
+
+def run(pages: int, records_per_page: int, workers: int, chunk_pages: int, repeat: int, directory: str):
+    file_path = os.path.join(directory, f"ekp_{pages}.pdf")
+    write_pdf(file_path, generate_pages(pages, records_per_page))
+    print(f"\nДокумент: {pages} страниц, {os.path.getsize(file_path) / 1024 / 1024:.1f} МБ")
+    print(f"{'Стадия':<36}{'Время, с':>10}{'Стр./с':>10}{'Пик, МБ':>10}")
+
+    events = None
+    for name, func in get_stages(file_path, workers, chunk_pages):
+        seconds, peak, result = measure(func, repeat)
+        if name.startswith("Сквозной"):
+            events = result
+        print(f"{name:<36}{seconds:>10.3f}{pages / seconds:>10.0f}{peak / 1024 / 1024:>10.1f}")
+
+    print(f"Событий: {len(events)}")
+    if len(events) != pages * records_per_page:
+        raise SystemExit(f"Ожидалось {pages * records_per_page} событий")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--records-per-page", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-pages", type=int, default=fn.PDF_CHUNK_PAGES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Кеш событий пишется во временный каталог, а не в FILES_PATH
+        fn.EVENTS_CACHE_PATH = os.path.join(directory, "events_cache")
+        for pages in args.pages:
+            run(pages, args.records_per_page, args.workers, args.chunk_pages, args.repeat, directory)
+
+
+if __name__ == "__main__":
+    main()
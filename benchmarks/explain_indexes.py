@@ -0,0 +1,204 @@
+"""
+Проверка, что запросы обёрток DB используют индексы.
+
+Скрипт в одной транзакции наполняет events, fsp_events и tokens
+синтетическими строками, обновляет статистику (ANALYZE) и для каждого
+запроса из обёрток снимает EXPLAIN (FORMAT JSON). Ожидается сканирование
+по указанному индексу, иначе скрипт завершается с ошибкой. В конце
+транзакция откатывается, данные в базе не меняются.
+
+Нужна база с применёнными миграциями (alembic upgrade head).
+
+Запуск:
+    python -m benchmarks.explain_indexes --rows 50000
+"""
+import argparse
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from DB.DataBase import SessionMaker
+from DB.event import Event
+from DB.FSPevent import FSPevent
+from DB.token import Token
+from DB.models.enums.FSPevent_status import FSPEventStatus
+from DB.models.enums.regions import Regions
+from DB.models.enums.token_types import TokenTypes
+
+INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+EVENTS_SEED_SQL = """
+    INSERT INTO events (
+        id, event_id, sport, title, participants, participants_num, discipline, place,
+        gender, date_start, date_end, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), 9000000000000000 + i, 'СПОРТ ' || (i % 200), 'СОРЕВНОВАНИЯ ' || md5(i::text), 'мужчины', '100',
+        'ДИСЦИПЛИНА ' || (i % 20), 'РОССИЯ', '[]'::jsonb,
+        timestamp '2015-01-01' + (i % 3650) * interval '1 day',
+        timestamp '2015-01-01' + (i % 3650 + 2) * interval '1 day',
+        now(), now()
+    FROM generate_series(1, :rows) AS i
+"""
+
+FSP_EVENTS_SEED_SQL = """
+    INSERT INTO fsp_events (
+        id, sport, title, description, participants, participants_num, discipline, region,
+        representative, place, date_start, date_end, status, files, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), 'Спортивное программирование', 'Соревнования', '', 'Команды', '10',
+        'Дисциплина ' || (i % 20),
+        (enum_range(NULL::regions))[1 + i % array_length(enum_range(NULL::regions), 1)],
+        '', 'Москва',
+        timestamp '2015-01-01' + (i % 3650) * interval '1 day',
+        timestamp '2015-01-01' + (i % 3650 + 1) * interval '1 day',
+        (enum_range(NULL::fspeventstatus))[1 + i % 3],
+        '[]'::jsonb, now(), now()
+    FROM generate_series(1, :rows) AS i
+"""
+
+TOKENS_SEED_SQL = """
+    INSERT INTO tokens (id, user_email, token_type, token, created_at, expires_at)
+    SELECT
+        gen_random_uuid(), 'user' || i || '@example.com',
+        (enum_range(NULL::tokentypes))[1 + i % 2], (100000 + i % 900000)::text,
+        now(), now() + interval '15 minutes'
+    FROM generate_series(1, :rows) AS i
+"""
+
+SEED_SQL = (EVENTS_SEED_SQL, FSP_EVENTS_SEED_SQL, TOKENS_SEED_SQL)
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) над запросом, параметры передаются драйверу как обычно."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def get_queries() -> list[tuple[str, str, object]]:
+    """Запросы обёрток и индекс, которым они должны пользоваться."""
+    date_start = datetime(2024, 6, 1)
+    return [
+        (
+            "Event.get_by_filters (sport, discipline, date_start)",
+            "ix_events_sport_discipline_date_start",
+            Event(sport="СПОРТ 7", discipline="ДИСЦИПЛИНА 7", date_start=date_start).get_by_filters_query(),
+        ),
+        (
+            "Event.get_by_filters (sport)",
+            "ix_events_sport_discipline_date_start",
+            Event(sport="СПОРТ 7").get_by_filters_query(),
+        ),
+        (
+            "Event.get_by_event_id",
+            "ix_events_event_id",
+            Event.get_by_event_id_query(9000000000000042),
+        ),
+        (
+            "Event.get_by_filters (date_start, date_end)",
+            "ix_events_date_range",
+            Event(date_start=datetime(2016, 3, 1), date_end=datetime(2016, 3, 10)).get_by_filters_query(),
+        ),
+        (
+            "Event.get_events_by_date",
+            "ix_events_date_range",
+            Event.get_events_by_date_query(datetime(2016, 3, 1)),
+        ),
+        (
+            "Event.get_events_in_window",
+            "ix_events_date_range",
+            Event().get_events_in_window_query(datetime(2016, 3, 1), datetime(2016, 3, 31)),
+        ),
+        (
+            "Event.get_disciplines_by_sport",
+            "ix_events_sport_discipline_date_start",
+            Event.get_disciplines_by_sport_query("СПОРТ 7"),
+        ),
+        (
+            "Event.get_random_events",
+            "ix_events_sample_key",
+            Event.get_random_events_query(10),
+        ),
+        (
+            "Event.get_random_events (sport)",
+            "ix_events_sport_sample_key",
+            Event.get_random_events_query(10, sport="СПОРТ 7"),
+        ),
+        (
+            "Event.search",
+            "ix_events_title_trgm",
+            Event().search_query(hashlib.md5(b"42").hexdigest()[:12]),
+        ),
+        (
+            "FSPevent.get_by_filters",
+            "ix_fsp_events_region_status_discipline_date_start",
+            FSPevent(
+                region=Regions.MOSCOW,
+                status=FSPEventStatus.APPROVED,
+                discipline="Дисциплина 7",
+                date_start=date_start,
+            ).get_by_filters_query(),
+        ),
+        (
+            "FSPevent.get_by_filters (date_start, date_end)",
+            "ix_fsp_events_date_range",
+            FSPevent(date_start=datetime(2016, 3, 1), date_end=datetime(2016, 3, 10)).get_by_filters_query(),
+        ),
+        (
+            "Token.get",
+            "ix_tokens_user_email_token_type_token",
+            Token(token="100042", user_email="user42@example.com", token_type=TokenTypes.VERIFY_EMAIL).get_query(),
+        ),
+    ]
+
+
+def iter_plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    failed = []
+    with SessionMaker().session_factory() as session:
+        try:
+            for seed_sql in SEED_SQL:
+                session.execute(text(seed_sql), {"rows": args.rows})
+            session.execute(text("ANALYZE events, fsp_events, tokens"))
+
+            for name, index_name, query in get_queries():
+                plan = session.execute(Explain(query)).scalar()[0]["Plan"]
+                scans = [
+                    (node["Node Type"], node.get("Index Name"))
+                    for node in iter_plan_nodes(plan)
+                    if node["Node Type"] in INDEX_SCANS
+                ]
+                ok = any(scan_index == index_name for _, scan_index in scans)
+                print(f"{'OK  ' if ok else 'FAIL'} {name}: {scans or plan['Node Type']}")
+                if not ok:
+                    failed.append(name)
+        finally:
+            session.rollback()
+
+    if failed:
+        raise SystemExit(f"Без ожидаемого индекса: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
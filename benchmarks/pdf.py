@@ -0,0 +1,112 @@
+"""Минимальный генератор PDF с текстом на кириллице без внешних зависимостей."""
+import string
+
+# Однобайтовая кодировка шрифта: печатные ASCII как есть, кириллица с 0x80
+CYRILLIC = "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯабвгдеёжзийклмнопрстуфхцчшщъыьэюя№"
+ENCODING = {char: ord(char) for char in string.printable if 32 <= ord(char) < 127}
+ENCODING.update({char: 0x80 + index for index, char in enumerate(CYRILLIC)})
+
+FONT_SIZE = 9
+LEADING = 11
+MARGIN = 30
+PAGE_WIDTH = 595
+
+
+def get_to_unicode_cmap() -> bytes:
+    """CMap ToUnicode, по которой PyPDF2 восстанавливает кириллицу из однобайтовых кодов."""
+    mappings = "\n".join(
+        f"<{0x80 + index:02X}> <{ord(char):04X}>" for index, char in enumerate(CYRILLIC)
+    )
+    return (
+        "/CIDInit /ProcSet findresource begin\n"
+        "12 dict begin\n"
+        "begincmap\n"
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+        "/CMapName /Adobe-Identity-UCS def\n"
+        "/CMapType 2 def\n"
+        "1 begincodespacerange\n<00> <FF>\nendcodespacerange\n"
+        "95 beginbfrange\n"
+        + "\n".join(f"<{code:02X}> <{code:02X}> <{code:04X}>" for code in range(32, 127))
+        + "\nendbfrange\n"
+        f"{len(CYRILLIC)} beginbfchar\n{mappings}\nendbfchar\n"
+        "endcmap\n"
+        "CMapName currentdict /CMap defineresource pop\n"
+        "end\nend\n"
+    ).encode("ascii")
+
+
+def encode_line(line: str) -> bytes:
+    """Кодирует строку в литерал PDF с экранированием скобок и обратной косой черты."""
+    result = bytearray()
+    for char in line:
+        code = ENCODING.get(char, ord("?"))
+        if code in (0x28, 0x29, 0x5C):
+            result.append(0x5C)
+        result.append(code)
+    return bytes(result)
+
+
+def get_page_height(text: str) -> int:
+    """Высота страницы, на которой помещаются все строки текста."""
+    return text.count("\n") * LEADING + MARGIN * 2
+
+
+def get_page_content(text: str) -> bytes:
+    lines = text.split("\n")
+    operations = [
+        b"BT",
+        b"/F1 %d Tf" % FONT_SIZE,
+        b"%d TL" % LEADING,
+        b"%d %d Td" % (MARGIN, get_page_height(text) - MARGIN),
+    ]
+    for line in lines:
+        operations.append(b"(" + encode_line(line) + b") Tj T*")
+    operations.append(b"ET")
+    return b"\n".join(operations)
+
+
+def write_pdf(file_path: str, pages: list[str]):
+    """
+    Записывает PDF, каждая строка текста страницы выводится отдельной строкой.
+
+    Объекты пишутся в файл по мере формирования, в памяти остаются только
+    смещения объектов для таблицы xref.
+    """
+    # 1 - каталог, 2 - дерево страниц, 3 - шрифт, 4 - CMap, далее пары страница/содержимое
+    page_ids = [5 + index * 2 for index in range(len(pages))]
+    offsets = {}
+
+    with open(file_path, "wb") as file:
+        def write_object(object_id: int, body: bytes):
+            offsets[object_id] = file.tell()
+            file.write(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+        def write_stream(object_id: int, data: bytes):
+            write_object(object_id, b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+
+        file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+        write_object(2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(pages))
+        write_object(
+            3,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+            b"/Encoding /WinAnsiEncoding /ToUnicode 4 0 R >>",
+        )
+        write_stream(4, get_to_unicode_cmap())
+
+        for page_id, text in zip(page_ids, pages):
+            write_object(
+                page_id,
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                % (PAGE_WIDTH, get_page_height(text), page_id + 1),
+            )
+            write_stream(page_id + 1, get_page_content(text))
+
+        xref_offset = file.tell()
+        size = max(offsets) + 1
+        file.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for object_id in range(1, size):
+            file.write(b"%010d 00000 n \n" % offsets[object_id])
+        file.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
@@ -0,0 +1,125 @@
+"""
+Стоимость строки в списках событий: прежний путь (модель целиком и
+обёртка FSPevent на каждую строку) против выборки колонок в FSPeventRow/Row.
+
+Без --db замеряется только сборка объектов из уже полученных строк.
+С --db в одной транзакции в events и fsp_events добавляется --rows
+синтетических строк, замеряется выборка вместе со сборкой, затем
+транзакция откатывается.
+
+Запуск:
+    python -m benchmarks.row_mapping --rows 50000
+    python -m benchmarks.row_mapping --rows 50000 --db
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, text
+
+from benchmarks.explain_indexes import EVENTS_SEED_SQL, FSP_EVENTS_SEED_SQL
+from DB.DataBase import SessionMaker
+from DB.event import Event, EVENT_LIST_COLUMNS
+from DB.FSPevent import FSPevent, FSPeventRow, FSPEVENT_ROW_COLUMNS
+from DB.models.event import Events
+from DB.models.FSPevent import FSPEvents
+from DB.models.enums.FSPevent_status import FSPEventStatus
+from DB.models.enums.regions import Regions
+
+
+def legacy_fsp_events(models: list[FSPEvents]) -> list[FSPevent]:
+    """Прежний FSPevent.get_by_filters: обёртка FSPevent на каждую модель."""
+    manager = FSPevent()
+    res = []
+    for model in models:
+        e = FSPevent(**manager.get_from_model(model))
+        e.event_id = model.id
+        res.append(e)
+
+    return res
+
+
+def get_fsp_values(rows: int) -> list[tuple]:
+    regions = list(Regions)
+    statuses = list(FSPEventStatus)
+    date_start = datetime(2025, 1, 1)
+    return [
+        (
+            uuid.uuid4(), "Спортивное программирование", "Соревнования", "", None, "Команды", "10",
+            f"Дисциплина {i % 20}", regions[i % len(regions)], "", [], "Москва",
+            date_start + timedelta(days=i % 365), date_start + timedelta(days=i % 365 + 1),
+            statuses[i % len(statuses)],
+        )
+        for i in range(rows)
+    ]
+
+
+def measure(name: str, func, rows: int):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"{name:<44}{seconds:>9.3f} с{seconds / max(len(result), 1) * 1e6:>9.2f} мкс/строка")
+    return result
+
+
+def run_offline(rows: int):
+    print(f"\nСборка объектов, {rows} строк FSP событий")
+    values = get_fsp_values(rows)
+    fields = [column.key for column in FSPEVENT_ROW_COLUMNS]
+    models = [FSPEvents(**dict(zip(fields, value))) for value in values]
+
+    measure("Прежний путь: FSPevent на модель", lambda: legacy_fsp_events(models), rows)
+    measure("Новый путь: FSPeventRow из строки", lambda: [FSPeventRow(*value) for value in values], rows)
+
+
+def run_db(rows: int):
+    print(f"\nВыборка и сборка из БД, +{rows} строк в events и fsp_events")
+    with SessionMaker().session_factory() as session:
+        try:
+            session.execute(text(EVENTS_SEED_SQL), {"rows": rows})
+            session.execute(text(FSP_EVENTS_SEED_SQL), {"rows": rows})
+            session.execute(text("ANALYZE events, fsp_events"))
+
+            measure(
+                "Event: модели Events целиком",
+                lambda: session.scalars(select(Events)).all(),
+                rows,
+            )
+            session.expunge_all()
+            measure(
+                "Event: колонки EVENT_LIST_COLUMNS",
+                lambda: session.execute(Event().get_by_filters_query(*EVENT_LIST_COLUMNS)).all(),
+                rows,
+            )
+            measure(
+                "FSPevent: модели и обёртки FSPevent",
+                lambda: legacy_fsp_events(session.scalars(select(FSPEvents)).all()),
+                rows,
+            )
+            session.expunge_all()
+            measure(
+                "FSPevent: колонки в FSPeventRow",
+                lambda: [
+                    FSPeventRow(*row)
+                    for row in session.execute(FSPevent().get_by_filters_query(*FSPEVENT_ROW_COLUMNS))
+                ],
+                rows,
+            )
+        finally:
+            session.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--db", action="store_true", help="Замер выборки из PostgreSQL")
+    args = parser.parse_args()
+
+    run_offline(args.rows)
+    if args.db:
+        run_db(args.rows)
+
+
+if __name__ == "__main__":
+    main()
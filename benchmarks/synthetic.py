@@ -0,0 +1,86 @@
+import random
+
+SPORTS = [
+    "АВИАМОДЕЛЬНЫЙ СПОРТ",
+    "АКРОБАТИЧЕСКИЙ РОК-Н-РОЛЛ",
+    "БАСКЕТБОЛ",
+    "БОКС",
+    "ГРЕБНОЙ СЛАЛОМ",
+    "ЛЫЖНЫЕ ГОНКИ",
+    "САМБО",
+    "СПОРТИВНОЕ ПРОГРАММИРОВАНИЕ",
+    "ТХЭКВОНДО (ВТФ)",
+    "ФУТБОЛ",
+    "ХОККЕЙ С МЯЧОМ",
+    "ШАХМАТЫ",
+]
+TITLES = [
+    "ЧЕМПИОНАТ РОССИИ",
+    "ПЕРВЕНСТВО РОССИИ",
+    "КУБОК РОССИИ",
+    "ВСЕРОССИЙСКИЕ СОРЕВНОВАНИЯ",
+    "ЧЕМПИОНАТ ЦЕНТРАЛЬНОГО ФЕДЕРАЛЬНОГО ОКРУГА",
+]
+PARTICIPANTS = [
+    "мужчины, женщины",
+    "юниоры, юниорки до 21 года",
+    "юноши, девушки 14-15 лет",
+    "мальчики, девочки до 13 лет",
+]
+DISCIPLINES = [
+    "КОМАНДНЫЕ СОРЕВНОВАНИЯ",
+    "ЛИЧНЫЕ СОРЕВНОВАНИЯ",
+    "СПРИНТ",
+    "ЭСТАФЕТА",
+]
+PLACES = [
+    "РОССИЯ, г. Москва",
+    "РОССИЯ, Московская обл., г. Химки",
+    "РОССИЯ, Республика Татарстан, г. Казань",
+    "РОССИЯ, Новосибирская обл., г. Новосибирск",
+]
+
+
+def generate_records(records: int, seed: int = 0):
+    """Отдаёт строки синтетического ЕКП: заголовки видов спорта и записи."""
+    rng = random.Random(seed)
+    per_sport = max(1, -(-records // len(SPORTS)))
+    number = 10 ** 15
+
+    for index in range(records):
+        if index % per_sport == 0:
+            sport = SPORTS[(index // per_sport) % len(SPORTS)]
+            yield sport
+            yield "Основной состав"
+        elif index % per_sport == per_sport // 2:
+            yield "Молодежный (резервный) состав"
+
+        number += rng.randint(1, 1000)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 27)
+        yield str(number)
+        yield rng.choice(TITLES)
+        yield rng.choice(PARTICIPANTS)
+        yield rng.choice(DISCIPLINES)
+        yield f"{day:02d}.{month:02d}.2025 {day + 1:02d}.{month:02d}.2025"
+        yield rng.choice(PLACES)
+        yield str(rng.randint(10, 3000))
+
+
+def generate_pages(pages: int = 2495, records_per_page: int = 16, seed: int = 0) -> list[str]:
+    """
+    Собирает текст страниц синтетического ЕКП в раскладке PyPDF2.
+
+    Строки делятся на страницы поровну, поэтому записи и заголовки
+    переходят через границы страниц, как в настоящем документе.
+    Каждая страница заканчивается колонтитулом "Стр. N из M".
+    """
+    lines = list(generate_records(pages * records_per_page, seed))
+    per_page = -(-len(lines) // pages)
+
+    result = []
+    for page in range(pages):
+        body = "\n".join(lines[page * per_page:(page + 1) * per_page])
+        result.append(f"{body}\nСтр. {page + 1} из {pages}\n")
+
+    return result
@@ -0,0 +1,119 @@
+"""
+Стоимость создания обёрток DB: прежний перебор enum и атрибуты в __dict__
+против словарей get_enum_lookup и __slots__.
+
+Legacy* повторяют прежние __init__ обёрток FSPevent и User: сессия в
+атрибуте экземпляра и перебор Regions/FSPEventStatus/UserRoles.
+Регион берётся из конца Regions, как у большинства регионов РФ.
+Память на экземпляр считается по tracemalloc для --objects объектов.
+
+Запуск:
+    python -m benchmarks.wrapper_construction --objects 50000
+"""
+import argparse
+import time
+import tracemalloc
+from enum import Enum
+
+from DB.DataBase import SessionMaker
+from DB.FSPevent import FSPevent
+from DB.user import User
+from DB.models.enums.FSPevent_status import FSPEventStatus
+from DB.models.enums.regions import Regions
+from DB.models.enums.user_roles import UserRoles
+
+
+def legacy_to_enum(enum_class: type[Enum], key):
+    """Прежние convert_*_to_key: линейный перебор enum."""
+    if isinstance(key, Enum):
+        return key
+
+    for member in enum_class:
+        if member.value == key or member.name == key:
+            return member
+
+    return key
+
+
+class LegacyFSPevent:
+    def __init__(self, id=None, sport=None, title=None, description=None, admin_description=None,
+                 participants=None, participants_num=None, discipline=None, region=None,
+                 representative=None, files=None, place=None, date_start=None, date_end=None,
+                 status=None, auto_add=False):
+        self.sessionmaker = SessionMaker().session_factory
+        self.id = id
+        self.event_id = id
+        self.sport = sport
+        self.title = title
+        self.description = description
+        self.admin_description = admin_description
+        self.participants = participants
+        self.participants_num = participants_num
+        self.discipline = discipline
+        self.place = place
+        self.region = legacy_to_enum(Regions, region)
+        self.status = legacy_to_enum(FSPEventStatus, status)
+        self.representative = representative
+        self.files = files
+        self.date_start = date_start
+        self.date_end = date_end
+        self.auto_add = auto_add
+
+
+class LegacyUser:
+    def __init__(self, id=None, is_verified=False, name=None, email=None, password=None, tg_id=None,
+                 username=None, region=None, role=None, notifications=None, auto_add=False):
+        self.sessionmaker = SessionMaker().session_factory
+        self.id = id
+        self.is_verified = is_verified
+        self.name = name
+        self.email = email
+        self.password = password
+        self.tg_id = int(tg_id) if tg_id is not None else None
+        self.username = username
+        self.notifications = notifications if notifications is not None else []
+        self.region = legacy_to_enum(Regions, region)
+        self.role = legacy_to_enum(UserRoles, role)
+        self.auto_add = auto_add
+        self.created_at = None
+        self.updated_at = None
+
+
+def measure(name: str, func, objects: int):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841 - объекты живы во время замера
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(f"{name:<36}{seconds / objects * 1e6:>10.2f}{current / objects:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=50000)
+    args = parser.parse_args()
+    objects = args.objects
+
+    # Словари enum строятся при первом обращении, в замер это не входит
+    FSPevent(region=Regions.NONE.value, status=FSPEventStatus.APPROVED.value)
+    User(region=Regions.NONE.name, role=UserRoles.USER.name)
+
+    region = list(Regions)[-1]
+    fsp_kwargs = {"title": "Соревнования", "region": region.value, "status": FSPEventStatus.REJECTED.value}
+    user_kwargs = {"email": "user@example.com", "region": region.name, "role": UserRoles.ADMIN.name}
+
+    print(f"{'Обёртка':<36}{'мкс/шт':>10}{'Б/шт':>10}")
+    measure("Прежний FSPevent", lambda: [LegacyFSPevent(**fsp_kwargs) for _ in range(objects)], objects)
+    measure("FSPevent", lambda: [FSPevent(**fsp_kwargs) for _ in range(objects)], objects)
+    measure("Прежний User", lambda: [LegacyUser(**user_kwargs) for _ in range(objects)], objects)
+    measure("User", lambda: [User(**user_kwargs) for _ in range(objects)], objects)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from datetime import datetime
 from DB.event import Event
 
 from blueprints.api.v1.responses import get_200, get_400, get_500
+from blueprints.api.v1.pagination import get_page_params, get_page_response
 
 events = Blueprint("events", __name__)
 logger = logging.getLogger(__name__)
@@ -18,41 +19,95 @@ def api_get_events():
         date_start = request.form.get("date_start")
         date_end = request.form.get("date_end")
         selected_date = request.form.get("selected_date")
+        try:
+            page_params = get_page_params()
+        except ValueError:
+            return get_400("limit must be a positive integer")
+
         if selected_date:
             selected_date = datetime.strptime(selected_date, '%Y-%m-%d')
-            events_objects = Event().get_events_by_date(selected_date)
+            event = Event()
+            if page_params is None:
+                events_objects = event.get_events_by_date(selected_date)
+            else:
+                page = event.get_events_by_date_page(selected_date, **page_params)
         else:
             if date_start:
                 date_start = datetime.strptime(date_start, "%Y-%m-%d")
             if date_end:
                 date_end = datetime.strptime(date_end, "%Y-%m-%d")
             event = Event(sport=sport, date_start=date_start, date_end=date_end)
-            events_objects = event.get_by_filters()
-        events = []
-        for event in events_objects:
-            events.append({
-                'event_id': event.event_id,
-                'title': event.title,
-                'discipline': event.discipline,
-                'participants': event.participants,
-                'participants_num': event.participants_num,
-                'sport': event.sport,
-                'date_start': event.date_start.strftime('%Y-%m-%d') if event.date_start else None,
-                'date_end': event.date_end.strftime('%Y-%m-%d') if event.date_end else None,
-                'place': event.place
-            })
+            if page_params is None:
+                events_objects = event.get_by_filters()
+            else:
+                page = event.get_by_filters_page(**page_params)
+
+        if page_params is not None:
+            return get_200(get_page_response(page, [get_event_response(event) for event in page["items"]]))
+
+        events = [get_event_response(event) for event in events_objects]
 
         return get_200(events)
+    except ValueError as e:
+        logger.error(f"Error in get_events: {e}")
+        return get_400("Invalid request parameters")
     except Exception as e:
         logger.error(f"Error in get_events: {e}")
         return get_500("Error in get_events")
 
 
+@events.post("/calendar")
+def api_get_calendar_events():
+    """События, которые хотя бы одним днём попадают в окно дат [date_from, date_to] (например, месяц)"""
+    try:
+        date_from = request.form.get("date_from")
+        date_to = request.form.get("date_to")
+        if not date_from or not date_to:
+            return get_400("date_from and date_to are required")
+
+        try:
+            date_from = datetime.strptime(date_from, "%Y-%m-%d")
+            date_to = datetime.strptime(date_to, "%Y-%m-%d")
+        except ValueError:
+            return get_400("Dates must be in YYYY-MM-DD format")
+
+        if date_from > date_to:
+            return get_400("date_from must not be later than date_to")
+
+        event = Event(sport=request.form.get("sport"), discipline=request.form.get("discipline"))
+        events = [get_event_response(event) for event in event.get_events_in_window(date_from, date_to)]
+
+        return get_200(events)
+    except Exception as e:
+        logger.error(f"Error in get_calendar_events: {e}")
+        return get_500("Error in get_calendar_events")
+
+
+def get_event_response(event) -> dict:
+    return {
+        'event_id': event.event_id,
+        'title': event.title,
+        'discipline': event.discipline,
+        'participants': event.participants,
+        'participants_num': event.participants_num,
+        'sport': event.sport,
+        'date_start': event.date_start.strftime('%Y-%m-%d') if event.date_start else None,
+        'date_end': event.date_end.strftime('%Y-%m-%d') if event.date_end else None,
+        'place': event.place
+    }
+
+
 @events.post("/random")
 def api_get_random_events():
     try:
+        sport = request.form.get("sport") or None
+        upcoming = request.form.get("upcoming") == "true"
+
         event_manager: Event = Event()
-        random_events = [event_manager.event_to_dict(event) for event in event_manager.get_random_events()]
+        random_events = [
+            event_manager.event_to_dict(event)
+            for event in event_manager.get_random_events(sport=sport, upcoming=upcoming)
+        ]
 
         return get_200(random_events)
     except Exception as e:
@@ -6,11 +6,12 @@ from flask import Blueprint, request
 from DB.FSPevent import FSPevent
 from DB.FSPevent_archive import FSPevent_archive
 from DB.models.enums.user_roles import UserRoles
-from DB.user import User
 from DB.models.enums.FSPevent_status import FSPEventStatus
 
 from blueprints.api.v1.responses import get_200, get_400, get_404, get_500
 from blueprints.jwt_guard import jwt_guard, check_admin
+from blueprints.api.v1.pagination import get_page_params, get_page_response
+from blueprints.api.v1.representatives import set_representatives
 
 from S3Manager.S3Manager import S3Manager
 
@@ -36,20 +37,27 @@ def api_get_fsp_events():
         if date_end:
             date_end = datetime.strptime(date_end, "%Y-%m-%d")
 
+        try:
+            page_params = get_page_params()
+        except ValueError:
+            return get_400("limit must be a positive integer")
+
         if archive:
             event = FSPevent_archive(date_start=date_start, date_end=date_end, discipline=discipline, region=region)
         else:
             event = FSPevent(date_start=date_start, date_end=date_end, discipline=discipline, status=status,
                              region=region)
 
-        events = event.get_by_filters()
+        if page_params is None:
+            events = event.get_by_filters()
+        else:
+            page = event.get_by_filters_page(**page_params)
+            events = page["items"]
+
+        set_representatives(events)
+
         res = []
         for event in events:
-            if event.representative is not None:
-                user = User(event.representative)
-                if user.get():
-                    event.representative = user.get_self_response()
-
             data = event.get_self()
             data["id"] = event.id
             data["date_start"] = event.date_start.strftime('%d.%m.%Y %H:%M')
@@ -59,7 +67,13 @@ def api_get_fsp_events():
 
             res.append(data)
 
+        if page_params is not None:
+            return get_200(get_page_response(page, res))
+
         return get_200(res)
+    except ValueError as e:
+        logger.error(f"Error in api_get_fsp_events: {e}")
+        return get_400("Invalid request parameters")
     except Exception as e:
         logger.error(f"Error in api_get_fsp_events: {e}")
         return get_500("Error in api_get_fsp_events")
@@ -115,10 +129,7 @@ def api_add_fsp_event():
                     s3_manager.delete_files(file_paths)
                     return get_500("Error updating event with files")
 
-        if event.representative is not None:
-            user = User(event.representative)
-            if user.get():
-                event.representative = user.get_self_response()
+        set_representatives([event])
 
         data = event.get_self()
         data["id"] = event.id
@@ -170,10 +181,7 @@ def api_update_fsp_event():
         if not event.update(event_data):
             return get_500("Error in update")
 
-        if event.representative is not None:
-            user = User(event.representative)
-            if user.get():
-                event.representative = user.get_self_response()
+        set_representatives([event])
 
         data = event.get_self()
         data["id"] = event.id
@@ -211,10 +219,7 @@ def api_archive_fsp_event():
 
         event.delete()
 
-        if archive_event.representative is not None:
-            user = User(archive_event.representative)
-            if user.get():
-                archive_event.representative = user.get_self_response()
+        set_representatives([archive_event])
 
         data = archive_event.get_self()
         data["id"] = archive_event.id
@@ -251,10 +256,7 @@ def api_restore_fsp_event():
 
         archive_event.delete()
 
-        if event.representative is not None:
-            user = User(event.representative)
-            if user.get():
-                event.representative = user.get_self_response()
+        set_representatives([event])
 
         data = event.get_self()
         data["id"] = event.id
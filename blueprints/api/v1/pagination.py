@@ -0,0 +1,31 @@
+from flask import request
+
+from DB.pagination import get_page_limit
+
+
+def get_page_params() -> dict | None:
+    """
+    Параметры постраничной выдачи из формы запроса.
+
+    Постраничная выдача включается, только если клиент передал limit или
+    cursor, иначе эндпоинты отдают прежний полный список.
+
+    Raises:
+        ValueError: limit не положительное число
+    """
+    if request.form.get("limit") is None and request.form.get("cursor") is None:
+        return None
+
+    return {
+        "limit": get_page_limit(request.form.get("limit")),
+        "cursor": request.form.get("cursor") or None,
+        "with_total": request.form.get("with_total") == "true",
+    }
+
+
+def get_page_response(page: dict, items: list) -> dict:
+    return {
+        "items": items,
+        "next_cursor": page["next_cursor"],
+        "total": page["total"],
+    }
@@ -0,0 +1,40 @@
+from flask import request
+
+from DB.user import User
+
+
+def get_users(ids) -> dict[str, User]:
+    """
+    Пользователи по id с картой идентичности на время запроса.
+
+    Уже загруженные в этом запросе пользователи (включая request.user)
+    берутся из request.users, остальные догружаются одним запросом.
+    """
+    users = getattr(request, "users", None)
+    if users is None:
+        users = {}
+        current_user = getattr(request, "user", None)
+        if current_user is not None and current_user.id is not None:
+            users[str(current_user.id)] = current_user
+        request.users = users
+
+    missing = {str(id) for id in ids if id is not None} - users.keys()
+    if missing:
+        found = User().get_many(missing)
+        for id in missing:
+            # Отсутствующих тоже запоминаем, чтобы не искать их повторно
+            users[id] = found.get(id)
+
+    return users
+
+
+def set_representatives(events) -> None:
+    """Заменяет id представителя событий на данные пользователя, если он найден"""
+    users = get_users(event.representative for event in events)
+    for event in events:
+        if event.representative is None:
+            continue
+
+        representative = users.get(str(event.representative))
+        if representative is not None:
+            event.representative = representative.get_self_response()
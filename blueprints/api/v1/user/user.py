@@ -7,9 +7,15 @@ from flask import Blueprint, request
 from DB.user import User
 from DB.models.enums.user_roles import UserRoles
 from DB.FSPevent import FSPevent
+from DB.notification import Notification
+from DB.models.enums.notification_categories import NotificationCategories
+from DB.DataBase import SessionMaker
 
 from blueprints.api.v1.responses import get_200, get_400, get_401, get_403, get_404, get_500
 from blueprints.jwt_guard import jwt_guard, check_user, check_admin
+from blueprints.api.v1.representatives import set_representatives
+
+from celery_app.notification_queue import schedule_notifications, unschedule_notifications
 
 from emailer.EmailService import EmailService
 
@@ -167,6 +173,20 @@ def delete_user():
         return get_500("Error in delete_user")
 
 
+@user.post("/db_pool")
+@jwt_guard
+@check_admin
+def get_db_pool_stats():
+    """Состояние пула соединений БД в процессе, обработавшем запрос"""
+    try:
+        data = SessionMaker().pool_stats()
+        data["pid"] = os.getpid()
+        return get_200(data)
+    except Exception as e:
+        logger.error(f"Error in get_db_pool_stats: {e}")
+        return get_500("Error in get_db_pool_stats")
+
+
 @user.post("/subscribe")
 @jwt_guard
 @check_user
@@ -193,37 +213,20 @@ def get_subscriber():
         else:
             notification_time = now + timedelta(days=1)
 
-        notification = {
-            "sport": "Спортивное программирование",
-            "search_query": event.title,
-            "notification_time": notification_time.isoformat(),
-            "notification_sent": False,
-            "event_category": "FSP",
-            "event_id": event.id,
-            "email": True,
-            "telegram": True,
-        }
-
-        user.notifications.append(notification)
-        user.update({})
-
-        res = []
-        for notification in user.notifications:
-            event = FSPevent(id=notification["event_id"])
-            if event.get() is None:
-                continue
-
-            if event.representative is not None:
-                representative = User(event.representative)
-                if representative.get():
-                    event.representative = representative.get_self_response()
+        notification = Notification(
+            user_id=user.id,
+            event_category=NotificationCategories.FSP,
+            event_id=event.id,
+            sport="Спортивное программирование",
+            search_query=event.title,
+            notification_time=notification_time,
+        )
+        if not notification.add():
+            return get_500("Error in get_subscriber")
 
-            data = event.get_self()
-            data["id"] = event.id
-            data.pop("admin_description")
-            res.append(data)
+        schedule_notifications([notification])
 
-        return get_200(res)
+        return get_200(get_subscriptions_response(user))
     except Exception as e:
         logger.error(f"Error in get_subscriber: {e}")
         return get_500("Error in get_subscriber")
@@ -239,25 +242,24 @@ def unsubscribe():
         event_id = request.form.get("id")
         res = []
 
-        for notification in user.notifications:
-            if notification["event_id"] == event_id:
-                user.notifications.remove(notification)
-                user.update({})
+        if not event_id:
+            return get_400("Event id is required")
 
-                event = FSPevent(id=notification["event_id"])
-                if event.get() is None:
-                    return get_200(res)
-                
-                if event.representative is not None:
-                    representative = User(event.representative)
-                    if user.get():
-                        event.representative = representative.get_self_response()
+        notifications = Notification(user_id=user.id, event_id=event_id).get_by_filters()
+        if notifications:
+            notifications[0].delete()
+            unschedule_notifications([notifications[0].id])
+
+            event = FSPevent(id=event_id)
+            if event.get() is None:
+                return get_200(res)
 
-                data = event.get_self()
-                data["id"] = event.id
-                data.pop("admin_description")
-                res.append(data)
-                break
+            set_representatives([event])
+
+            data = event.get_self()
+            data["id"] = event.id
+            data.pop("admin_description")
+            res.append(data)
 
         return get_200(res)
     except Exception as e:
@@ -280,34 +282,21 @@ def set_up_notification():
         if telegram and user.tg_id is None:
             return get_400("User has no telegram id")
 
-        for notification in user.notifications:
-            if notification["event_id"] == event_id:
-                notification["telegram"] = telegram
-                notification["email"] = email
-                if notification_time:
-                    notification["notification_time"] = datetime.strptime(notification_time,
-                                                                          "%Y-%m-%d %H:%M").isoformat()
+        notifications = Notification(user_id=user.id, event_id=event_id).get_by_filters() if event_id else []
+        if notifications:
+            data = {"telegram": telegram, "email": email}
+            if notification_time:
+                # Новое время - уведомление снова ждёт отправки
+                data["notification_time"] = datetime.strptime(notification_time, "%Y-%m-%d %H:%M")
+                data["notification_sent"] = False
 
-                user.update({})
-                break
+            if not notifications[0].update(data):
+                return get_500("Error in set_up_notification")
 
-        res = []
-        for notification in user.notifications:
-            event = FSPevent(id=notification["event_id"])
-            if event.get() is None:
-                continue
+            if notification_time:
+                schedule_notifications([notifications[0]])
 
-            if event.representative is not None:
-                representative = User(event.representative)
-                if user.get():
-                    event.representative = representative.get_self_response()
-
-            data = event.get_self()
-            data["id"] = event.id
-            data.pop("admin_description")
-            res.append(data)
-
-        return get_200(res)
+        return get_200(get_subscriptions_response(user))
     except Exception as e:
         logger.error(f"Error in set_up_notification: {e}")
         return get_500("Error in set_up_notification")
@@ -320,34 +309,32 @@ def get_notifications():
     """Получение событий по уведомлениям"""
     try:
         user: User = request.user
-        res = []
-        for notification in user.notifications:
-            event = FSPevent(id=notification["event_id"])
-            if event.get() is None:
-                continue
-
-            if event.representative is not None:
-                representative = User(event.representative)
-                if representative.get():
-                    event.representative = representative.get_self_response()
-
-            data = event.get_self()
-            data["id"] = event.id
-            data.pop("admin_description")
-            res.append(data)
-
-        return get_200(res)
+        return get_200(get_subscriptions_response(user))
     except Exception as e:
         logger.error(f"Error in get_notifications: {e}")
         return get_500("Error in get_notifications")
 
-# notifications = [{
-#     "sport": str,
-#     "search_query": str,
-#     "notification_time": datetime,
-#     "notification_sent": bool,
-#     "event_category": "event" | "category" | "FSP",
-#     "event_id": int | None,
-#     "email": bool,
-#     "telegram": bool,
-# }]
+
+def get_subscriptions_response(user: User) -> list[dict]:
+    """
+    События подписок пользователя в порядке добавления подписок.
+
+    Подписки, события и их представители загружаются тремя запросами,
+    независимо от количества подписок.
+    """
+    notifications = Notification(user_id=user.id).get_by_filters()
+    events = FSPevent().get_many(notification.event_id for notification in notifications)
+    set_representatives(list(events.values()))
+
+    res = []
+    for notification in notifications:
+        event = events.get(notification.event_id)
+        if event is None:
+            continue
+
+        data = event.get_self()
+        data["id"] = event.id
+        data.pop("admin_description")
+        res.append(data)
+
+    return res
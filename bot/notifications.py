@@ -3,7 +3,8 @@ from bot.bot import bot
 import logging
 import os
 from dotenv import load_dotenv
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+import asyncio
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -26,21 +27,7 @@ async def send_event_notification(
         bool: True если уведомление успешно отправлено
     """
     try:
-        # Создаем клавиатуру с кнопкой для перехода к событию
-        keyboard = InlineKeyboardMarkup(inline_keyboard=[[
-            InlineKeyboardButton(
-                text="Подробнее о событии",
-                url=f"https://{os.getenv('MAIN_URL')}/events/{event_data['id']}"
-            )
-        ]])
-
-        # Форматируем сообщение с дополнительной информацией
-        detailed_message = (
-            f"{message}\n\n"
-            f"🏆 Вид спорта: {event_data['sport']}\n"
-            f"📍 Место проведения: {event_data['place']}\n"
-            f"🕒 Начало: {event_data['start_time']}"
-        )
+        detailed_message, keyboard = format_event_notification(message, event_data)
 
         # Отправляем сообщение с клавиатурой
         await bot.send_message(
@@ -56,4 +43,71 @@ async def send_event_notification(
 
     except Exception as e:
         logger.error(f"Ошибка при отправке уведомления в Telegram для пользователя {telegram_id}: {e}")
-        return False 
+        return False
+
+
+def format_event_notification(message: str, event_data: dict) -> tuple[str, InlineKeyboardMarkup]:
+    """Текст уведомления о событии и клавиатура с кнопкой для перехода к событию"""
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[[
+        InlineKeyboardButton(
+            text="Подробнее о событии",
+            url=f"https://{os.getenv('MAIN_URL')}/events/{event_data['id']}"
+        )
+    ]])
+
+    # Форматируем сообщение с дополнительной информацией
+    detailed_message = (
+        f"{message}\n\n"
+        f"🏆 Вид спорта: {event_data['sport']}\n"
+        f"📍 Место проведения: {event_data['place']}\n"
+        f"🕒 Начало: {event_data['start_time']}"
+    )
+    return detailed_message, keyboard
+
+
+async def send_event_notifications(
+    telegram_ids: list[int],
+    message: str,
+    event_data: dict
+) -> list[int]:
+    """
+    Отправляет одно уведомление о событии нескольким пользователям Telegram.
+
+    Сообщение форматируется один раз, все запросы идут через одну HTTP сессию
+    бота, которая закрывается в конце: вызывающий код запускает функцию через
+    asyncio.run, и сессия не должна пережить свой event loop.
+
+    Returns:
+        list[int]: ID пользователей, которым уведомление отправить не удалось
+    """
+    detailed_message, keyboard = format_event_notification(message, event_data)
+    failed = []
+
+    try:
+        for telegram_id in telegram_ids:
+            for attempt in range(2):
+                try:
+                    await bot.send_message(chat_id=telegram_id, text=detailed_message, reply_markup=keyboard)
+                    break
+
+                except TelegramRetryAfter as e:
+                    # Лимит Telegram: ждём и повторяем один раз
+                    if attempt:
+                        logger.error(f"Лимит Telegram при отправке уведомления пользователю {telegram_id}: {e}")
+                        failed.append(telegram_id)
+                        break
+
+                    await asyncio.sleep(e.retry_after)
+
+                except TelegramBadRequest as e:
+                    logger.info(f"Пользователь {telegram_id} отписался от уведомлений: {e}")
+                    break
+
+                except Exception as e:
+                    logger.error(f"Ошибка при отправке уведомления в Telegram для пользователя {telegram_id}: {e}")
+                    failed.append(telegram_id)
+                    break
+    finally:
+        await bot.session.close()
+
+    return failed
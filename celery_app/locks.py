@@ -0,0 +1,48 @@
+import logging
+import uuid
+from functools import cache
+
+import redis
+
+from celery_app.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Удаляет ключ, только если он всё ещё принадлежит владельцу токена: после
+# истечения аренды блокировку мог взять другой обработчик
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@cache
+def get_release_lock_script():
+    return get_redis().register_script(RELEASE_LOCK_SCRIPT)
+
+
+def acquire_lock(key: str, ttl: int) -> str | None:
+    """
+    Берёт блокировку-аренду key на ttl миллисекунд.
+
+    Returns:
+        str | None: Токен владельца для release_lock или None, если
+        блокировку держит другой обработчик
+    """
+    token = uuid.uuid4().hex
+    if get_redis().set(key, token, nx=True, px=ttl):
+        return token
+
+    return None
+
+
+def release_lock(key: str, token: str) -> bool:
+    """Снимает блокировку, если она ещё принадлежит token"""
+    try:
+        return bool(get_release_lock_script()(keys=[key], args=[token]))
+    except redis.RedisError as e:
+        # Блокировка всё равно истечёт по ttl
+        logger.error(f"Не удалось снять блокировку {key}: {e}")
+        return False
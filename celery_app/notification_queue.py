@@ -0,0 +1,75 @@
+import logging
+from datetime import datetime
+from functools import cache
+
+import redis
+
+from celery_app.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# ZSET: id уведомления -> unix-время отправки
+NOTIFICATION_QUEUE_KEY = "notifications:due"
+
+# Забирает наступившие уведомления атомарно, поэтому два планировщика
+# не получат одно и то же уведомление
+POP_DUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #ids > 0 then
+    redis.call('ZREM', KEYS[1], unpack(ids))
+end
+return ids
+"""
+
+
+@cache
+def get_pop_due_script():
+    return get_redis().register_script(POP_DUE_SCRIPT)
+
+
+def schedule_notifications(notifications) -> bool:
+    """
+    Ставит уведомления в очередь на их notification_time или переносит их.
+
+    Очередь - ускоритель доставки: источником правды остаётся таблица
+    notifications, а пропущенное из-за сбоя Redis уведомление отправит
+    check_upcoming_events. Поэтому ошибка Redis только логируется.
+    """
+    mapping = {
+        str(notification.id): notification.notification_time.timestamp()
+        for notification in notifications
+        if notification.notification_time is not None and not notification.notification_sent
+    }
+    if not mapping:
+        return True
+
+    try:
+        get_redis().zadd(NOTIFICATION_QUEUE_KEY, mapping)
+        return True
+    except redis.RedisError as e:
+        logger.error(f"Не удалось поставить уведомления в очередь: {e}")
+        return False
+
+
+def unschedule_notifications(ids) -> bool:
+    ids = [str(id) for id in ids]
+    if not ids:
+        return True
+
+    try:
+        get_redis().zrem(NOTIFICATION_QUEUE_KEY, *ids)
+        return True
+    except redis.RedisError as e:
+        logger.error(f"Не удалось убрать уведомления из очереди: {e}")
+        return False
+
+
+def pop_due_notifications(now: datetime, count: int) -> list[str]:
+    """Забирает из очереди до count уведомлений, время которых наступило"""
+    return get_pop_due_script()(keys=[NOTIFICATION_QUEUE_KEY], args=[now.timestamp(), count])
+
+
+def get_next_due() -> datetime | None:
+    """Время ближайшего уведомления в очереди"""
+    first = get_redis().zrange(NOTIFICATION_QUEUE_KEY, 0, 0, withscores=True)
+    return datetime.fromtimestamp(first[0][1]) if first else None
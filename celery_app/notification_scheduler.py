@@ -0,0 +1,78 @@
+"""
+Планировщик уведомлений: забирает из очереди Redis уведомления, время
+которых наступило, и ставит их на отправку в Celery.
+
+Очередь - ZSET NOTIFICATION_QUEUE_KEY (id уведомления -> время отправки),
+её пополняют эндпоинты /api/user. При запуске в очередь заново ставятся все
+неотправленные уведомления из БД, так что очередь переживает потерю Redis.
+
+Запуск:
+    python -m celery_app.notification_scheduler
+"""
+import argparse
+import logging
+import time
+from datetime import datetime
+
+from DB.notification import Notification
+from celery_app.notification_queue import (
+    schedule_notifications,
+    pop_due_notifications,
+    get_next_due,
+)
+from celery_app.tasks import send_due_notifications
+
+logger = logging.getLogger(__name__)
+
+# Сколько уведомлений уходит в одну задачу send_due_notifications
+BATCH_SIZE = 500
+# Наибольшая пауза между проверками: новое уведомление с ближайшим временем
+# попадёт в очередь в любой момент, поэтому долго спать нельзя
+MAX_SLEEP = 1.0
+
+
+def schedule_pending(batch_size: int = BATCH_SIZE) -> int:
+    """Ставит в очередь все неотправленные уведомления из БД, пачками по мере чтения"""
+    scheduled = 0
+    for notifications in Notification().iter_due(datetime.max, batch_size):
+        schedule_notifications(notifications)
+        scheduled += len(notifications)
+
+    return scheduled
+
+
+def run(batch_size: int = BATCH_SIZE, max_sleep: float = MAX_SLEEP):
+    logger.info(f"В очередь поставлено {schedule_pending(batch_size)} уведомлений")
+
+    while True:
+        try:
+            ids = pop_due_notifications(datetime.now(), batch_size)
+            if ids:
+                send_due_notifications.delay(ids)
+                continue
+
+            next_due = get_next_due()
+            sleep = max_sleep
+            if next_due is not None:
+                sleep = min(max((next_due - datetime.now()).total_seconds(), 0), max_sleep)
+
+            time.sleep(sleep)
+        except Exception as e:
+            # Уведомления, которые не удалось забрать или поставить в Celery,
+            # отправит check_upcoming_events
+            logger.error(f"Ошибка очереди уведомлений: {e}")
+            time.sleep(max_sleep)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--max-sleep", type=float, default=MAX_SLEEP)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(args.batch_size, args.max_sleep)
+
+
+if __name__ == "__main__":
+    main()
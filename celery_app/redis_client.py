@@ -0,0 +1,13 @@
+import os
+from functools import cache
+
+import redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@cache
+def get_redis() -> redis.Redis:
+    """Клиент Redis процесса; пул соединений redis-py сам пересоздаётся после fork()"""
+    return redis.Redis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"), decode_responses=True)
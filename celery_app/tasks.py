@@ -1,29 +1,31 @@
 from celery_app.celery import celery
-from datetime import datetime, timedelta
+from celery import chord
+from datetime import datetime
 import logging
+import os
+import time
 from dotenv import load_dotenv
 import asyncio
 from parsing.sportevents_parser import main as parsing_main
 from DB.event import Event
 from DB.FSPevent import FSPevent
 from DB.user import User
-from bot.notifications import send_event_notification
+from DB.notification import Notification
+from DB.models.enums.notification_categories import NotificationCategories
+from celery_app.locks import acquire_lock, release_lock
+from bot.notifications import send_event_notification, send_event_notifications
 from emailer.EmailService import EmailService
 from typing import List
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-# notifications = [{
-#     "sport": str,
-#     "search_query": str,
-#     "notification_time": datetime,
-#     "notification_sent": bool,
-#     "event_category": "event" | "category" | "FSP",
-#     "event_id": int | None,
-#     "email": bool,
-#     "telegram": bool,
-# }]
+# На сколько шардов по хешу user_id делится проверка уведомлений
+NOTIFICATION_SHARDS = int(os.getenv("NOTIFICATION_SHARDS", 4))
+# Аренда блокировки шарда в мс, должна быть дольше обработки одного шарда
+NOTIFICATION_SHARD_LOCK_TTL = int(os.getenv("NOTIFICATION_SHARD_LOCK_TTL", 9 * 60 * 1000))
+# Сколько получателей одного события отправляет одна задача send_event_notifications_chunk
+NOTIFICATION_CHUNK_SIZE = int(os.getenv("NOTIFICATION_CHUNK_SIZE", 200))
 
 
 @celery.task
@@ -41,95 +43,339 @@ def update_events():
 
 @celery.task
 def check_upcoming_events():
-    """Проверка приближающихся событий и отправка уведомлений"""
+    """
+    Страховочная проверка уведомлений, пропущенных очередью Redis.
+
+    В срок уведомления отправляет notification_scheduler через
+    send_due_notifications. Здесь неотправленные уведомления, время которых
+    уже прошло (планировщик стоял или Redis потерял очередь), забираются
+    параллельно в NOTIFICATION_SHARDS задачах check_upcoming_events_shard.
+    Отправленные уведомления остаются подписками пользователя, удаляются
+    только подписки на завершившиеся события (см. deliver_notifications).
+    """
     try:
-        event_manager = Event()
-        users = User(auto_add=False).get_users_with_notifications()
-        notifications_sent = 0
-
-        for user in users:
-            notifications_updated = False
-            notifications_to_remove = []
-
-            for notification in user.notifications:
-                if notification.get('notification_sent', False):
-                    notification_time = datetime.fromisoformat(notification["notification_time"])
-                    if notification_time > datetime.now() + timedelta(days=1):
-                        notifications_to_remove.append(notification)
-                    continue
+        now = datetime.now()
+        shards = NOTIFICATION_SHARDS
+        chord(
+            [check_upcoming_events_shard.s(shard, shards, now.isoformat()) for shard in range(shards)]
+        )(report_notification_shards.s())
 
-                notification_time = datetime.fromisoformat(notification['notification_time'])
-                now = datetime.now()
-                next_check = now + timedelta(minutes=10)
+        logger.info(f"Проверка уведомлений запущена в {shards} шардах")
+        return f"Проверка уведомлений запущена в {shards} шардах"
+    except Exception as e:
+        logger.error(f"Ошибка при проверке приближающихся событий: {e}")
+        raise
 
-                # Проверяем, находится ли время уведомления в текущем интервале проверки
-                if not (now <= notification_time <= next_check):
-                    continue
 
-                events = []
-                if notification['event_category'] == 'event' and notification.get('event_id'):
-                    event = event_manager.get_by_event_id(notification['event_id'])
-                    if event:
-                        events = [event]
-                        if event_manager.is_event_finished(event):
-                            notifications_to_remove.append(notification)
-                            continue
-
-                elif notification['event_category'] == 'FSP':
-                    events = FSPevent(id=notification['event_id']).get_by_filters()
-                else:
-                    events = event_manager.get_events_by_filters({
-                        'sport': notification['sport'],
-                        'search_query': notification['search_query']
-                    })
-
-                if events:
-                    for event in events:
-                        send_notification.delay(
-                            message=f"Скоро начнется событие: {event.title} в {event.date_start.strftime('%d.%m.%Y %H:%M')}",
-                            event_data={
-                                'id': event.event_id,
-                                'title': event.title,
-                                'sport': event.sport,
-                                'start_time': event.date_start.strftime('%d.%m.%Y %H:%M'),
-                                'date_start': event.date_start.strftime('%d.%m.%Y %H:%M'),
-                                'place': event.place,
-                                'notification_time': notification['notification_time']
-                            },
-                            notification_settings={
-                                'telegram': notification['telegram'],
-                                'email': notification['email']
-                            },
-                            user_data={
-                                'tg_id': user.tg_id,
-                                'email': user.email
-                            }
-                        )
-                        notifications_sent += 1
-
-                    notification['notification_sent'] = True
-                    notifications_updated = True
-
-            # Удаляем помеченные уведомления
-            for notification in notifications_to_remove:
-                user.notifications.remove(notification)
-                notifications_updated = True
-
-            # Сохраняем изменения только если были обновления
-            if notifications_updated:
-                # Создаем новый объект User для сохранения
-                updated_user = User(id=user.id)
-                if updated_user.get():
-                    updated_user.notifications = user.notifications
-                    updated_user.update()
-
-        logger.info(f"Отправлено {notifications_sent} уведомлений о предстоящих событиях")
+@celery.task
+def check_upcoming_events_shard(shard: int, shards: int, now: str) -> dict:
+    """
+    Проверка уведомлений пользователей одного шарда.
+
+    Шард защищён блокировкой-арендой в Redis: если предыдущий запуск beat
+    ещё обрабатывает этот шард, задача пропускает его. Повторной отправки
+    не будет и при истёкшей аренде блокировки, так как уведомления
+    забираются через Notification.claim_due.
+
+    Returns:
+        dict: Результат и время обработки шарда для report_notification_shards
+    """
+    key = f"notifications:shard:{shards}:{shard}"
+    result = {"shard": shard, "skipped": False, "notifications": 0, "sent": 0, "claim_time": 0.0, "time": 0.0}
+
+    token = acquire_lock(key, NOTIFICATION_SHARD_LOCK_TTL)
+    if token is None:
+        logger.info(f"Шард уведомлений {shard}/{shards} ещё обрабатывается, пропускаем")
+        result["skipped"] = True
+        return result
+
+    try:
+        now = datetime.fromisoformat(now)
+        start = time.perf_counter()
+
+        notifications = Notification().claim_due(now, shard, shards)
+        result["claim_time"] = time.perf_counter() - start
+
+        result["notifications"] = len(notifications)
+        result["sent"] = deliver_notifications(notifications, now)
+        result["time"] = time.perf_counter() - start
+
+        logger.info(
+            f"Шард уведомлений {shard}/{shards}: {result['notifications']} уведомлений, "
+            f"{result['sent']} отправок за {result['time']:.3f} с (claim {result['claim_time']:.3f} с)"
+        )
+        return result
+    except Exception as e:
+        logger.error(f"Ошибка при проверке шарда уведомлений {shard}/{shards}: {e}")
+        raise
+    finally:
+        release_lock(key, token)
+
+
+@celery.task
+def report_notification_shards(results: list[dict]) -> dict:
+    """
+    Сводка по шардам проверки уведомлений.
+
+    Время самого долгого шарда против среднего показывает перекос между
+    шардами, а доля пропущенных - что шарды не успевают между запусками beat
+    и NOTIFICATION_SHARDS пора увеличить.
+    """
+    processed = [result for result in results if not result["skipped"]]
+    times = [result["time"] for result in processed]
+
+    report = {
+        "shards": len(results),
+        "skipped": len(results) - len(processed),
+        "notifications": sum(result["notifications"] for result in processed),
+        "sent": sum(result["sent"] for result in processed),
+        "max_time": max(times, default=0.0),
+        "avg_time": sum(times) / len(times) if times else 0.0,
+    }
+
+    logger.info(
+        f"Отправлено {report['sent']} уведомлений о предстоящих событиях: "
+        f"шардов {report['shards']}, пропущено {report['skipped']}, "
+        f"время шарда max {report['max_time']:.3f} с, avg {report['avg_time']:.3f} с"
+    )
+    return report
+
+
+@celery.task
+def send_due_notifications(ids: list[str]):
+    """Отправка уведомлений, которые notification_scheduler забрал из очереди"""
+    try:
+        notifications_sent = deliver_notifications(Notification().claim(ids), datetime.now())
         return f"Отправлено {notifications_sent} уведомлений о предстоящих событиях"
     except Exception as e:
-        logger.error(f"Ошибка при проверке приближающихся событий: {e}")
+        logger.error(f"Ошибка при отправке уведомлений из очереди: {e}")
         raise
 
 
+def deliver_notifications(notifications: list[Notification], now: datetime) -> int:
+    """
+    Ставит send_event_notifications_chunk для получателей каждого события.
+
+    Уведомления уже должны быть забраны через Notification.claim, чтобы их
+    не отправил второй обработчик. Отправленными они отмечаются только после
+    постановки всех задач: если постановка упала, уведомления снова заберёт
+    check_upcoming_events по истечении DB.notification.CLAIM_LEASE.
+    Пользователи, события ЕКП и FSP события загружаются пачкой, уведомления о
+    завершившихся событиях ЕКП и ФСП удаляются. Получатели одного события
+    собираются вместе и делятся на задачи по NOTIFICATION_CHUNK_SIZE,
+    пользователь с несколькими подписками на событие получит одно уведомление.
+
+    Returns:
+        int: Количество получателей в поставленных задачах
+    """
+    users = User().get_many(notification.user_id for notification in notifications)
+    fsp_events = FSPevent().get_many(
+        notification.event_id
+        for notification in notifications
+        if notification.event_category == NotificationCategories.FSP
+    )
+    category_events = get_category_events(
+        [
+            notification
+            for notification in notifications
+            if notification.event_category == NotificationCategories.CATEGORY
+        ],
+        now,
+    )
+    ekp_events = Event().get_many_by_event_ids(
+        notification.event_id
+        for notification in notifications
+        if notification.event_category == NotificationCategories.EVENT
+    )
+
+    finished_ids = []
+    # (FSP ли событие, event_id) -> событие и получатели по id пользователя
+    events_by_key = {}
+    recipients_by_key = {}
+
+    for notification in notifications:
+        user = users.get(notification.user_id)
+        if user is None:
+            continue
+
+        events = []
+        if notification.event_category == NotificationCategories.EVENT:
+            event = ekp_events.get(notification.event_id)
+            if event is not None:
+                if event.date_end < now:
+                    finished_ids.append(notification.id)
+                    continue
+
+                events = [event]
+
+        elif notification.event_category == NotificationCategories.FSP:
+            event = fsp_events.get(notification.event_id)
+            if event is not None:
+                if event.date_end < now:
+                    finished_ids.append(notification.id)
+                    continue
+
+                events = [event]
+        else:
+            events = category_events.get(get_category_key(notification), [])
+
+        tg_id = user.tg_id if notification.telegram else None
+        email = user.email if notification.email else None
+        if not tg_id and not email:
+            continue
+
+        for event in events:
+            key = (notification.event_category == NotificationCategories.FSP, str(event.event_id))
+            events_by_key.setdefault(key, event)
+
+            # Одна запись на пользователя: каналы всех его подписок на событие объединяются
+            recipient = recipients_by_key.setdefault(key, {}).setdefault(user.id, {'tg_id': None, 'email': None})
+            recipient['tg_id'] = recipient['tg_id'] or tg_id
+            recipient['email'] = recipient['email'] or email
+
+    notifications_sent = 0
+    for key, recipients in recipients_by_key.items():
+        event = events_by_key[key]
+        recipients = list(recipients.values())
+        message, event_data = get_event_notification(event)
+
+        for start in range(0, len(recipients), NOTIFICATION_CHUNK_SIZE):
+            send_event_notifications_chunk.delay(
+                message=message,
+                event_data=event_data,
+                recipients=recipients[start:start + NOTIFICATION_CHUNK_SIZE]
+            )
+
+        notifications_sent += len(recipients)
+
+    notification_manager = Notification()
+    notification_manager.delete_by_ids(finished_ids)
+    finished_ids = set(finished_ids)
+    notification_manager.mark_sent(
+        [notification for notification in notifications if notification.id not in finished_ids]
+    )
+    return notifications_sent
+
+
+def get_event_notification(event) -> tuple[str, dict]:
+    """Текст уведомления и данные события для send_event_notifications_chunk"""
+    date_start = event.date_start.strftime('%d.%m.%Y %H:%M')
+    message = f"Скоро начнется событие: {event.title} в {date_start}"
+    event_data = {
+        'id': event.event_id,
+        'title': event.title,
+        'sport': event.sport,
+        'start_time': date_start,
+        'date_start': date_start,
+        'place': event.place,
+    }
+    return message, event_data
+
+
+def get_category_key(notification: Notification) -> tuple[str | None, str | None]:
+    """Нормализованные (sport, search_query) подписки на категорию"""
+    sport = notification.sport.strip() if notification.sport else None
+    search_query = " ".join(notification.search_query.split()).lower() if notification.search_query else None
+    return sport or None, search_query or None
+
+
+def get_category_events(notifications: list[Notification], now: datetime) -> dict[tuple, list]:
+    """
+    Предстоящие события для подписок на категорию.
+
+    Одинаковые подписки множества пользователей дают один запрос на каждый
+    различный get_category_key: события вида спорта, в названии которых есть
+    search_query (поиск по индексу ix_events_title_trgm).
+
+    Returns:
+        dict[tuple, list]: События по ключу get_category_key
+    """
+    res = {}
+    for notification in notifications:
+        key = get_category_key(notification)
+        if key in res:
+            continue
+
+        sport, search_query = key
+        event_manager = Event(sport=sport, date_start=now)
+        res[key] = event_manager.search(search_query) if search_query else event_manager.get_by_filters()
+
+    return res
+
+
+@celery.task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=300
+)
+def send_event_notifications_chunk(
+        self,
+        message: str,
+        event_data: dict,
+        recipients: list[dict]
+):
+    """
+    Отправка уведомления об одном событии пачке получателей.
+
+    Сообщение и письмо формируются один раз, Telegram использует одну сессию
+    бота, email - одно SMTP соединение. Повторяется не вся пачка, а только
+    получатели и каналы, по которым отправить не удалось: до 3 попыток с
+    интервалом в 5 минут.
+
+    Args:
+        message (str): Текст уведомления
+        event_data (dict): Данные о событии
+        recipients (list[dict]): Получатели {'tg_id': int | None, 'email': str | None},
+            None - канал не нужен
+    """
+    failed = send_event_notifications_to(message, event_data, recipients)
+    if not failed:
+        return f"Уведомления отправлены {len(recipients)} получателям"
+
+    logger.error(f"Не удалось отправить уведомления {len(failed)} из {len(recipients)} получателей")
+    if self.request.retries >= self.max_retries:
+        logger.error("Превышено максимальное количество попыток отправки уведомления")
+        return f"Уведомления отправлены {len(recipients) - len(failed)} из {len(recipients)} получателей"
+
+    raise self.retry(kwargs={'message': message, 'event_data': event_data, 'recipients': failed})
+
+
+def send_event_notifications_to(message: str, event_data: dict, recipients: list[dict]) -> list[dict]:
+    """
+    Returns:
+        list[dict]: Получатели только с каналами, по которым отправить не удалось
+    """
+    telegram_ids = [recipient['tg_id'] for recipient in recipients if recipient.get('tg_id')]
+    emails = [recipient['email'] for recipient in recipients if recipient.get('email')]
+
+    failed_telegram_ids = set()
+    if telegram_ids:
+        try:
+            failed_telegram_ids = set(asyncio.run(send_event_notifications(telegram_ids, message, event_data)))
+        except Exception as e:
+            logger.error(f"Ошибка при отправке уведомлений в Telegram: {e}")
+            failed_telegram_ids = set(telegram_ids)
+
+    failed_emails = set()
+    if emails:
+        try:
+            failed_emails = set(EmailService().send_event_notifications(emails, "Событие", event_data))
+        except Exception as e:
+            logger.error(f"Ошибка при отправке email: {e}")
+            failed_emails = set(emails)
+
+    failed = []
+    for recipient in recipients:
+        failed_recipient = {
+            'tg_id': recipient.get('tg_id') if recipient.get('tg_id') in failed_telegram_ids else None,
+            'email': recipient.get('email') if recipient.get('email') in failed_emails else None,
+        }
+        if failed_recipient['tg_id'] or failed_recipient['email']:
+            failed.append(failed_recipient)
+
+    return failed
+
+
 @celery.task(
     bind=True,
     max_retries=3,
@@ -89,6 +89,52 @@ class EmailService:
             print(f"Ошибка при отправке письма: {str(e)}")
             return False
 
+    def send_emails(self, to_emails: List[str], subject: str, body: str) -> List[str]:
+        """
+        Отправляет одно и то же письмо каждому адресату отдельно по общему SMTP соединению
+
+        Args:
+            to_emails: Адреса получателей
+            subject: Тема письма
+            body: Текст письма (HTML)
+
+        Returns:
+            List[str]: Адреса, которым письмо отправить не удалось
+        """
+        failed = []
+        server = None
+        try:
+            for to_email in to_emails:
+                try:
+                    if server is None:
+                        server = self._create_connection()
+
+                    msg = self._create_message(to_email, subject, body)
+                    server.sendmail(self.sender_email, [to_email], msg.as_string())
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as e:
+                    print(f"Ошибка при отправке письма на {to_email}: {str(e)}")
+                    failed.append(to_email)
+                except Exception as e:
+                    # Соединение могло оборваться: следующий адресат откроет новое
+                    print(f"Ошибка при отправке письма на {to_email}: {str(e)}")
+                    failed.append(to_email)
+                    self._close_connection(server)
+                    server = None
+        finally:
+            self._close_connection(server)
+
+        return failed
+
+    @staticmethod
+    def _close_connection(server: Optional[smtplib.SMTP]):
+        if server is None:
+            return
+
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
     def send_verification_email(self, to_email: str, verification_token: str) -> bool:
         """Отправляет письмо с подтверждением email"""
         template = self.env.get_template("verification_email.html")
@@ -113,11 +159,17 @@ class EmailService:
 
         return self.send_email(to_email, subject, body)
 
-    def send_event_notification(self, to_email: str, subject: str, event: str) -> bool:
-        """Отправляет уведомление о событии"""
+    def render_event_notification(self, event: dict) -> str:
         template = self.env.get_template("event_notification.html")
-        body = template.render(event=event)
-        return self.send_email(to_email, subject, body)
+        return template.render(event=event)
+
+    def send_event_notification(self, to_email: str, subject: str, event: dict) -> bool:
+        """Отправляет уведомление о событии"""
+        return self.send_email(to_email, subject, self.render_event_notification(event))
+
+    def send_event_notifications(self, to_emails: List[str], subject: str, event: dict) -> List[str]:
+        """Отправляет уведомление о событии нескольким адресатам, шаблон рендерится один раз"""
+        return self.send_emails(to_emails, subject, self.render_event_notification(event))
 
 
 if __name__ == "__main__":
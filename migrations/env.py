@@ -12,6 +12,7 @@ from DB.models.event import Events
 from DB.models.FSPevent import FSPEvents
 from DB.models.FSPevent_archive import FSPevent_archive
 from DB.models.token import Token
+from DB.models.notification import Notifications
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -38,6 +39,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Служебные таблицы перезагрузки событий (DB.event.Event.reload), в моделях их нет
+IGNORED_TABLES = ("events_shadow", "events_previous")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and name in IGNORED_TABLES:
+        return False
+
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -62,6 +73,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -82,7 +94,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
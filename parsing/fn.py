@@ -1,7 +1,14 @@
 import logging
 
+import base64
 import datetime
+import gzip
+import hashlib
+import itertools
+import multiprocessing
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from plistlib import dumps
 
 from utils import *
@@ -30,173 +37,618 @@ def extract_file_id(url: str) -> str:
         return None
 
 
-def get_last_file_id() -> str:
-    """Получает идентификатор последнего загруженного файла."""
+DOWNLOAD_STATE_PATH = os.path.join(FILES_PATH, "download_state.json")
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_CONCURRENCY = 4
+DOWNLOAD_FILE_TIMEOUT = 600
+
+
+def get_download_state() -> dict:
+    """
+    Читает состояние загрузок по URL: валидаторы HTTP (ETag, Last-Modified),
+    SHA-256 и размер скачанного файла, данные недокачанной части и SHA-256
+    последнего файла, загруженного в БД.
+    """
     try:
-        with open(os.path.join(FILES_PATH, "last_file_id.txt"), "r") as f:
-            return f.read().strip()
+        with open(DOWNLOAD_STATE_PATH, "r") as f:
+            return json.load(f)
     except FileNotFoundError:
-        return None
+        return {}
+    except json.JSONDecodeError as e:
+        logger.warning(f"Повреждено состояние загрузок, начинаем заново: {e}")
+        return {}
 
 
-def save_file_id(file_id: str):
-    """Сохраняет идентификатор файла."""
-    with open(os.path.join(FILES_PATH, "last_file_id.txt"), "w") as f:
-        f.write(file_id)
+def save_download_state(state: dict):
+    """Атомарно сохраняет состояние загрузок."""
+    with open(f"{DOWNLOAD_STATE_PATH}.tmp", "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(f"{DOWNLOAD_STATE_PATH}.tmp", DOWNLOAD_STATE_PATH)
 
 
-async def save_files(files_url: list[str]) -> list[str] | None:
-    if not files_url:
-        logger.error("Список URL файлов пуст")
-        return None
+def get_download_path(url: str) -> str:
+    file_id = extract_file_id(url) or hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(FILES_PATH, f"parse_data_{file_id}.pdf")
+
 
-    # Проверяем первый URL (предполагаем, что он основной)
-    file_id = extract_file_id(files_url[0])
-    if not file_id:
-        logger.error("Не удалось извлечь идентификатор файла из URL")
+def mark_files_loaded(files_url: list[str]):
+    """Отмечает скачанные файлы как загруженные в БД, после этого save_files считает их неизменёнными."""
+    state = get_download_state()
+    for file_url in files_url:
+        url_state = state.get(file_url)
+        if url_state and url_state.get("sha256"):
+            url_state["loaded_sha256"] = url_state["sha256"]
+    save_download_state(state)
+
+
+# Версия формата кеша разобранных событий. Увеличивается при изменении разбора PDF,
+# чтобы не использовать записи, полученные прежней версией парсера.
+EVENTS_CACHE_VERSION = 1
+EVENTS_CACHE_PATH = os.path.join(FILES_PATH, "events_cache")
+EVENTS_CACHE_KEEP = 3
+EVENTS_CACHE_COLUMNS = (
+    "event_id",
+    "sport",
+    "title",
+    "participants",
+    "participants_num",
+    "discipline",
+    "place",
+    "date_start",
+    "date_end",
+)
+EVENTS_CACHE_DATE_COLUMNS = ("date_start", "date_end")
+
+
+def get_file_sha256(file_path: str) -> str:
+    """Считает SHA-256 содержимого файла."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_events_cache_path(file_hash: str) -> str:
+    return os.path.join(EVENTS_CACHE_PATH, f"{file_hash}.v{EVENTS_CACHE_VERSION}.json.gz")
+
+
+def load_cached_events(file_hash: str) -> dict[str, list] | None:
+    """Читает разобранные события PDF из кеша по хешу содержимого файла по колонкам."""
+    try:
+        with gzip.open(get_events_cache_path(file_hash), "rt", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Не удалось прочитать кеш событий {file_hash}: {e}")
         return None
 
-    # Проверяем, изменился ли файл
-    last_file_id = get_last_file_id()
-    if last_file_id:
-        if last_file_id == file_id:
-            logger.info(f"Файл не изменился с последнего обновления (ID: {file_id})")
-            return None
-        else:
-            logger.info(f"Обнаружен новый файл (старый ID: {last_file_id}, новый ID: {file_id})")
-    else:
-        logger.info("Первая загрузка файла")
 
-    files_path = []
-    file_index = 1
-    
-    # Создаём директорию для файлов, если её нет
-    os.makedirs(FILES_PATH, exist_ok=True)
-    
-    for file_url in files_url:
+def iter_cached_events(columns: dict[str, list]):
+    """Отдаёт события из колонок кеша по одному."""
+    for row in zip(*(columns[column] for column in EVENTS_CACHE_COLUMNS)):
+        event = dict(zip(EVENTS_CACHE_COLUMNS, row))
+        for column in EVENTS_CACHE_DATE_COLUMNS:
+            event[column] = datetime.datetime.fromordinal(event[column])
+        yield event
+
+
+def get_cache_columns() -> dict[str, list]:
+    return {column: [] for column in EVENTS_CACHE_COLUMNS}
+
+
+def add_cached_event(columns: dict[str, list], event: dict):
+    """Добавляет событие в колонки кеша, даты переводятся в порядковые номера дней."""
+    for column in EVENTS_CACHE_COLUMNS:
+        value = event[column]
+        columns[column].append(value.toordinal() if column in EVENTS_CACHE_DATE_COLUMNS else value)
+
+
+def save_cached_events(file_hash: str, columns: dict[str, list]):
+    """
+    Сохраняет разобранные события PDF в кеш по колонкам.
+
+    Даты хранятся порядковыми номерами дней (см. add_cached_event),
+    файл сжимается gzip и записывается атомарно. Хранятся только EVENTS_CACHE_KEEP последних файлов.
+    """
+    os.makedirs(EVENTS_CACHE_PATH, exist_ok=True)
+    cache_path = get_events_cache_path(file_hash)
+    with gzip.open(f"{cache_path}.tmp", "wt", encoding="utf-8") as file:
+        json.dump(columns, file, ensure_ascii=False, separators=(",", ":"))
+    os.replace(f"{cache_path}.tmp", cache_path)
+
+    cache_files = sorted(
+        (os.path.join(EVENTS_CACHE_PATH, name) for name in os.listdir(EVENTS_CACHE_PATH)),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for old_path in cache_files[EVENTS_CACHE_KEEP:]:
+        os.remove(old_path)
+
+
+def get_expected_digest(headers: httpx.Headers) -> str | None:
+    """Достаёт SHA-256 представления из заголовков Repr-Digest или Digest, если сервер его прислал."""
+    repr_digest = re.search(r"sha-256=:([A-Za-z0-9+/=]+):", headers.get("repr-digest", ""))
+    if repr_digest:
+        return base64.b64decode(repr_digest.group(1)).hex()
+
+    digest = re.search(r"(?i)sha-256=([A-Za-z0-9+/=]+)", headers.get("digest", ""))
+    if digest:
+        return base64.b64decode(digest.group(1)).hex()
+
+    return None
+
+
+def verify_pdf_file(file_path: str, expected_size: int | None, expected_sha256: str | None, sha256: str):
+    """Проверяет размер, контрольную сумму и целостность PDF перед передачей парсеру."""
+    size = os.path.getsize(file_path)
+    if expected_size is not None and size != expected_size:
+        raise ValueError(f"Размер файла {size} не совпадает с ожидаемым {expected_size}")
+
+    if expected_sha256 is not None and sha256 != expected_sha256:
+        raise ValueError(f"SHA-256 файла {sha256} не совпадает с ожидаемым {expected_sha256}")
+
+    with open(file_path, "rb") as file:
+        if file.read(5) != b"%PDF-":
+            raise ValueError("Файл не является PDF")
+
+        file.seek(max(0, size - 1024))
+        if b"%%EOF" not in file.read():
+            raise ValueError("PDF файл обрезан: нет маркера %%EOF")
+
+
+async def download_file(client: httpx.AsyncClient, file_url: str, file_path: str, url_state: dict, on_progress) -> bool:
+    """
+    Потоково скачивает файл на диск с условными запросами и докачкой.
+
+    Если файл уже скачан и сохранены его валидаторы, отправляются
+    If-None-Match/If-Modified-Since, ответ 304 означает, что файл не изменился.
+    Недокачанная часть (.part) продолжается запросом Range с If-Range, если
+    сервер вернул весь файл, загрузка начинается заново. Ответ 416 значит,
+    что .part уже скачан целиком, но не переименован: если его размер равен
+    размеру из Content-Range и он проходит проверку, он становится файлом,
+    иначе удаляется и файл качается заново. Перед заменой файла
+    проверяются размер, SHA-256 (если сервер его прислал) и структура PDF.
+
+    Args:
+        client (httpx.AsyncClient): HTTP клиент
+        file_url (str): URL файла
+        file_path (str): Путь для сохранения
+        url_state (dict): Состояние загрузки этого URL, обновляется на месте
+        on_progress: Вызывается после изменения url_state, чтобы сохранить его
+
+    Returns:
+        bool: True, если файл скачан заново, False, если не изменился
+    """
+    part_path = f"{file_path}.part"
+    partial = url_state.get("partial") or {}
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    headers = {}
+    if offset and (partial.get("etag") or partial.get("last_modified")):
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = partial.get("etag") or partial["last_modified"]
+    else:
+        offset = 0
+        if os.path.exists(file_path) and url_state.get("sha256"):
+            if url_state.get("etag"):
+                headers["If-None-Match"] = url_state["etag"]
+            if url_state.get("last_modified"):
+                headers["If-Modified-Since"] = url_state["last_modified"]
+
+    async with client.stream("GET", file_url, headers=headers) as response:
+        if response.status_code == 304:
+            return False
+
+        if response.status_code == 416 and offset:
+            if complete_part_file(response, file_url, part_path, file_path, url_state, offset, on_progress):
+                return True
+
+            await response.aclose()
+            return await download_file(client, file_url, file_path, url_state, on_progress)
+
+        response.raise_for_status()
+
+        digest = hashlib.sha256()
+        if response.status_code == 206 and offset:
+            mode = "ab"
+            with open(part_path, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            total = re.search(r"/(\d+)$", response.headers.get("content-range", ""))
+            expected_size = int(total.group(1)) if total else None
+            logger.info(f"Докачка {file_url} с {offset} байт")
+        else:
+            mode = "wb"
+            content_length = response.headers.get("content-length")
+            expected_size = int(content_length) if content_length else None
+
+        url_state["partial"] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        on_progress()
+
+        with open(part_path, mode) as file:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+                digest.update(chunk)
+
+        sha256 = digest.hexdigest()
+        try:
+            verify_pdf_file(part_path, expected_size, get_expected_digest(response.headers), sha256)
+        except ValueError:
+            os.remove(part_path)
+            url_state.pop("partial", None)
+            on_progress()
+            raise
+
+        promote_part_file(
+            part_path, file_path, url_state, response.headers.get("etag"), response.headers.get("last-modified"), sha256
+        )
+        on_progress()
+
+    return True
+
+
+def complete_part_file(
+        response: httpx.Response,
+        file_url: str,
+        part_path: str,
+        file_path: str,
+        url_state: dict,
+        offset: int,
+        on_progress,
+) -> bool:
+    """
+    Обрабатывает ответ 416 на докачку .part.
+
+    Returns:
+        bool: True, если .part уже скачан целиком и стал файлом, False, если
+        он удалён вместе с данными докачки и файл нужно качать заново
+    """
+    partial = url_state.get("partial") or {}
+    total = re.search(r"\*/(\d+)$", response.headers.get("content-range", ""))
+    if total and int(total.group(1)) == offset:
+        sha256 = get_file_sha256(part_path)
+        try:
+            verify_pdf_file(part_path, offset, None, sha256)
+            promote_part_file(part_path, file_path, url_state, partial.get("etag"), partial.get("last_modified"), sha256)
+            on_progress()
+            logger.info(f"Недокачанная часть {file_url} уже скачана целиком")
+            return True
+        except ValueError as e:
+            logger.warning(f"Недокачанная часть {file_url} не прошла проверку: {e}")
+
+    logger.warning(f"Сервер отклонил докачку {file_url} с {offset} байт, скачиваем заново")
+    os.remove(part_path)
+    url_state.pop("partial", None)
+    on_progress()
+    return False
+
+
+def promote_part_file(
+        part_path: str,
+        file_path: str,
+        url_state: dict,
+        etag: str | None,
+        last_modified: str | None,
+        sha256: str,
+):
+    """Заменяет файл проверенной скачанной частью и запоминает её валидаторы"""
+    os.replace(part_path, file_path)
+    url_state.pop("partial", None)
+    url_state.update(
+        etag=etag,
+        last_modified=last_modified,
+        sha256=sha256,
+        size=os.path.getsize(file_path),
+    )
+
+
+async def fetch_file(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        file_url: str,
+        state: dict,
+        file_timeout: float,
+) -> str | None:
+    """Скачивает один файл с ограничением параллельности и общим таймаутом на файл."""
+    async with semaphore:
+        file_path = get_download_path(file_url)
+        url_state = state.setdefault(file_url, {})
         try:
-            current_file_id = extract_file_id(file_url)
-            if not current_file_id:
-                logger.warning(f"Пропуск URL из-за невозможности извлечь ID: {file_url}")
-                continue
-
-            with httpx.Client(follow_redirects=True, verify=False) as client:
-                response = client.get(file_url)
-                response.raise_for_status()
-
-                # Проверяем размер файла
-                content_length = int(response.headers.get('content-length', 0))
-                if content_length == 0:
-                    logger.warning(f"Пропуск пустого файла: {file_url}")
-                    continue
-
-                file_path = os.path.join(FILES_PATH, f"parse_data_{file_index}.pdf")
-                with open(file_path, "wb") as file:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        file.write(chunk)
-
-                # Проверяем, что файл действительно сохранился
-                if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-                    logger.error(f"Файл не был сохранен корректно: {file_path}")
-                    continue
-
-            files_path.append(file_path)
-            logger.info(f"Файл успешно скачан и сохранен: {file_path} (ID: {current_file_id})")
+            if os.path.exists(file_path) and url_state.get("sha256") != get_file_sha256(file_path):
+                logger.warning(f"Контрольная сумма {file_path} не совпадает, скачиваем заново")
+                url_state.pop("sha256", None)
+
+            downloaded = await asyncio.wait_for(
+                download_file(client, file_url, file_path, url_state, lambda: save_download_state(state)),
+                timeout=file_timeout,
+            )
+            if downloaded:
+                logger.info(f"Файл успешно скачан и сохранен: {file_path} (SHA-256: {url_state['sha256']})")
+            else:
+                logger.info(f"Файл не изменился на сервере: {file_url}")
+
+            return file_path
+        except asyncio.TimeoutError:
+            logger.error(f"Превышено время загрузки файла ({file_timeout} с): {file_url}")
         except httpx.RequestError as e:
             logger.error(f"Ошибка при выполнении запроса: {e}")
-            continue
         except httpx.HTTPStatusError as e:
-            logger.error(f"Ошибка HTTP статуса: {e.response.status_code} - {e.response.text}")
-            continue
+            logger.error(f"Ошибка HTTP статуса: {e.response.status_code}")
         except Exception as e:
             logger.error(f"Непредвиденная ошибка при сохранении файла: {e}")
-            continue
-        file_index += 1
 
-    # Сохраняем новый идентификатор файла только если успешно сохранили хотя бы один файл
-    if files_path:
-        save_file_id(file_id)
-        logger.info(f"Сохранен новый идентификатор файла: {file_id}")
-        return files_path
-    else:
-        logger.error("Не удалось сохранить ни один файл")
         return None
 
 
-async def extract_pdf_to_table(files_path: str):
-    files_dict = []
-    for file_path in files_path:
-        all_text = ""
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for i in range(len(reader.pages)):
-                page = reader.pages[i]
-                all_text += page.extract_text()
+async def save_files(
+        files_url: list[str],
+        concurrency: int = DOWNLOAD_CONCURRENCY,
+        file_timeout: float = DOWNLOAD_FILE_TIMEOUT,
+) -> list[str] | None:
+    """
+    Параллельно скачивает файлы ЕКП и возвращает пути к ним, если хотя бы один
+    файл отличается от загруженного в БД в прошлый раз (см. mark_files_loaded).
 
-        for i in range(1, 2496):
-            all_text = all_text.replace(f"Стр. {i} из 2495", "", 1)
+    Все файлы качаются через один httpx.AsyncClient с переиспользованием
+    соединений, одновременно не больше concurrency загрузок.
 
+    Args:
+        files_url (list[str]): URL частей ЕКП
+        concurrency (int): Максимальное число одновременных загрузок
+        file_timeout (float): Таймаут на загрузку одного файла, секунды
+
+    Returns:
+        list[str] | None: Пути ко всем файлам в порядке URL или None, если изменений нет
+    """
+    if not files_url:
+        logger.error("Список URL файлов пуст")
+        return None
+
+    # Создаём директорию для файлов, если её нет
+    os.makedirs(FILES_PATH, exist_ok=True)
+
+    state = get_download_state()
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(
+            follow_redirects=True,
+            verify=False,
+            timeout=httpx.Timeout(30.0),
+            limits=limits,
+    ) as client:
+        files_path = await asyncio.gather(
+            *(fetch_file(client, semaphore, file_url, state, file_timeout) for file_url in files_url)
+        )
+
+    if None in files_path:
+        # Синхронизация по неполному набору частей удалила бы события из остальных
+        logger.error("Не удалось скачать все части ЕКП, обновление пропущено")
+        return None
+
+    if all(state[file_url].get("loaded_sha256") == state[file_url]["sha256"] for file_url in files_url):
+        logger.info("Файлы не изменились с последнего обновления")
+        return None
+
+    return files_path
+
+
+# Колонтитул страницы вида "Стр. 12 из 2495" для любого числа страниц
+PAGE_FOOTER_PATTERN = re.compile(r"Стр\. [0-9]+ из [0-9]+")
+
+# Структурные токены ЕКП: заголовок вида спорта или 16-значный номер записи.
+# Lookbehind оставляет единственную попытку сопоставления заголовка на каждую
+# серию заглавных букв, поэтому сканирование остаётся линейным.
+EKP_TOKEN_PATTERN = re.compile(
+    r"(?<![А-ЯЁ\s()-])(?P<sport>[А-ЯЁ\s()-]+)\nОсновной состав"
+    r"|\b(?P<number>[0-9]{16})\b"
+)
+
+# Поля записи после названия и участников: последняя пара дат, место и число участников
+EVENT_TAIL_PATTERN = re.compile(
+    r"(?P<head>.*)(?P<date_start>[0-9.]{10}) (?P<date_end>[0-9.]{10})"
+    r"(?P<place>.*?)(?P<participants_num>[0-9]{1,5})?\Z",
+    re.S,
+)
+PARTICIPANTS_PATTERN = re.compile(r"[а-яё]+[а-яё0-9, \-]*[а-яё][а-яё0-9, \-]*")
+
+PDF_CHUNK_PAGES = 50
+
+
+def iter_pdf_pages(file_path: str):
+    """Постранично отдаёт текст PDF, не накапливая весь документ."""
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        for page in reader.pages:
+            yield page.extract_text()
+
+
+def _extract_pages_chunk(file_path: str, start: int, stop: int) -> list[str]:
+    """Извлекает текст страниц [start, stop) в дочернем процессе."""
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
+def iter_pdf_pages_parallel(file_path: str, workers: int, chunk_pages: int = PDF_CHUNK_PAGES):
+    """
+    Извлекает текст страниц PDF в пуле процессов и отдаёт его в порядке страниц.
+
+    Документ делится на блоки по chunk_pages страниц, одновременно в работе
+    не больше двух блоков на процесс, чтобы готовые, но ещё не прочитанные
+    страницы не копились в памяти.
+    """
+    with open(file_path, 'rb') as file:
+        page_count = len(PyPDF2.PdfReader(file).pages)
+
+    chunks = ((start, min(start + chunk_pages, page_count)) for start in range(0, page_count, chunk_pages))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            executor.submit(_extract_pages_chunk, file_path, start, stop)
+            for start, stop in itertools.islice(chunks, workers * 2)
+        )
+        while pending:
+            pages = pending.popleft().result()
+            for start, stop in itertools.islice(chunks, 1):
+                pending.append(executor.submit(_extract_pages_chunk, file_path, start, stop))
+
+            yield from pages
+
+
+def iter_sport_records(pages):
+    """
+    Разбивает поток страниц ЕКП на записи за один проход.
+
+    С каждой страницы снимается колонтитул, затем текст сканируется одним
+    скомпилированным шаблоном EKP_TOKEN_PATTERN. Между страницами переносится
+    только хвост после последнего найденного токена, поэтому память не зависит
+    от размера документа.
+
+    Yields:
+        tuple[str, str, str]: Вид спорта, 16-значный номер записи и её текст
+    """
+    sport = None
+    number = None
+    buffer = ""
+    pages = iter(pages)
+    final = False
+
+    while not final:
+        page_text = next(pages, None)
+        if page_text is None:
+            final = True
+        else:
+            buffer += PAGE_FOOTER_PATTERN.sub("", page_text, count=1)
+
+        consumed = 0
+        for token in EKP_TOKEN_PATTERN.finditer(buffer):
+            # Номер в самом конце буфера может продолжиться на следующей странице
+            if not final and token.end() == len(buffer):
+                break
+
+            if number is not None:
+                yield sport, number, buffer[consumed:token.start()]
+
+            number = None
+            if token.lastgroup == "sport":
+                sport = token.group("sport").strip(")").replace("\n", "")
+            elif sport is not None:
+                number = token.group("number")
+            consumed = token.end()
+
+        if final and number is not None:
+            yield sport, number, buffer[consumed:]
+
+        buffer = buffer[consumed:]
+
+
+def parse_event_record(number: str, text: str) -> dict | None:
+    """Разбирает текст одной записи ЕКП на поля события."""
+    text = text.replace("\n", " ").replace("Молодежный (резервный) состав", "").strip()
+
+    fields = EVENT_TAIL_PATTERN.match(text)
+    if fields is None:
+        logger.warning(f"Не найдены даты в записи {number}")
+        return None
+
+    head = fields.group("head")
+    participants = PARTICIPANTS_PATTERN.search(head)
+    if participants is None:
+        logger.warning(f"Не найдены участники в записи {number}")
+        return None
+
+    try:
+        date_start = datetime.datetime.strptime(fields.group("date_start"), "%d.%m.%Y")
+        date_end = datetime.datetime.strptime(fields.group("date_end"), "%d.%m.%Y")
+    except ValueError as e:
+        logger.warning(f"Некорректные даты в записи {number}: {e}")
+        return None
+
+    participants_text = participants.group(0).strip()
+    return {
+        "event_id": number,
+        "title": head[:participants.start()].strip(),
+        "participants": participants_text,
+        "participants_num": fields.group("participants_num") or "100",
+        "discipline": head[participants.start() + len(participants_text):].strip(),
+        "place": fields.group("place").strip().replace("  ", " "),
+        "date_start": date_start,
+        "date_end": date_end,
+    }
+
+
+def iter_pdf_events(file_path: str, workers: int | None = 1, chunk_pages: int = PDF_CHUNK_PAGES):
+    """
+    Отдаёт события из PDF файла ЕКП по мере чтения страниц.
+
+    Args:
+        file_path (str): Путь к PDF файлу
+        workers (int | None): Количество процессов для извлечения текста.
+            1 - последовательное чтение, None - по числу ядер
+        chunk_pages (int): Количество страниц в одном блоке для процесса
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and multiprocessing.current_process().daemon:
+        # Например, внутри prefork-воркера Celery: дочерние процессы запрещены
+        logger.warning("Параллельное извлечение недоступно в daemon-процессе, читаем последовательно")
+        workers = 1
+
+    if workers > 1:
+        pages = iter_pdf_pages_parallel(file_path, workers, chunk_pages)
+    else:
+        pages = iter_pdf_pages(file_path)
+
+    for sport, number, text in iter_sport_records(pages):
+        event = parse_event_record(number, text)
+        if event is None:
+            continue
+
+        event["sport"] = sport
+        yield event
+
+
+def get_pdf_events(file_path: str, workers: int | None = 1, chunk_pages: int = PDF_CHUNK_PAGES):
+    """
+    Отдаёт события PDF файла ЕКП по одному, используя кеш по SHA-256 содержимого.
+
+    Уже разобранный документ (в том числе переименованный или скачанный повторно)
+    не разбирается заново, а читается из кеша. При разборе события сразу
+    отдаются потребителю, для кеша копятся только значения колонок, а сам кеш
+    пишется, когда файл прочитан до конца.
+    """
+    file_hash = get_file_sha256(file_path)
+    columns = load_cached_events(file_hash)
+    if columns is not None:
+        logger.info(f"События файла {file_path} взяты из кеша ({file_hash})")
+        yield from iter_cached_events(columns)
+        return
+
+    columns = get_cache_columns()
+    for event in iter_pdf_events(file_path, workers, chunk_pages):
+        add_cached_event(columns, event)
+        yield event
+
+    try:
+        save_cached_events(file_hash, columns)
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить кеш событий {file_hash}: {e}")
+
+
+async def extract_pdf_to_table(
+        files_path: list[str],
+        workers: int | None = 1,
+        chunk_pages: int = PDF_CHUNK_PAGES,
+) -> list[dict[str, list[dict]]]:
+    files_dict = []
+    for file_path in files_path:
         table = {}
-        sport_pattern = r"([А-ЯЁ\s\(\)-]+)\nОсновной состав"
-        split_text_by_sport = re.split(sport_pattern, all_text)
-        matches = re.finditer(sport_pattern, all_text)
-        i = 1
-        for match in matches:
-            sport_name = match.group(1)
-            table[sport_name.strip(")").replace("\n", "")] = split_text_by_sport[i * 2].replace("\n", " ").replace("Молодежный (резервный) состав", "")
-            i += 1
-
-        for sport, text in table.copy().items():
-            split_by_number = re.split(r"(\b[0-9]{16}\b)", text)
-            split_by_number = [i for i in split_by_number]
-
-            even = split_by_number[::2]
-            odd = split_by_number[1::2]
-            result = {}
-            for x, y in zip(even[1:], odd):
-                if len(x) == 16:
-                    result[x] = y.strip()
-                else:
-                    result[y] = x.strip()
-            table[sport] = result
-
-        for sport, events in table.copy().items():
-            events_list = []
-            for number, text in events.copy().items():
-                buff = {}
-                print(text)
-                pattern = re.compile(r'[0-9.]{10} [0-9.]{10}')
-                dates = [match.group(0).strip() for match in pattern.finditer(text) if match.group(0).strip()][-1]
-                text = text.split(dates)
-                dates = dates.split(" ")
-
-                pattern = re.compile(r'(\d{1,5}$)')
-                try:
-                    participants_num = [match.group(0).strip() for match in pattern.finditer("".join(text)) if match.group(0).strip()][-1]
-                except:
-                    participants_num = "100"
-                text[1] = text[1][:-len(participants_num)]
-
-                pattern = re.compile(r'([а-яё]+[а-яё0-9, \-]*[а-яё][а-яё0-9, \-]*)')
-                participants = [match.group(0).strip() for match in pattern.finditer("".join(text[0])) if match.group(0).strip()][0]
-                place = text[1].strip().replace("\n", " ").replace("  ", " ")
-                text = text[0].split(participants)
-
-                title = text[0].strip()
-                discipline = text[1].strip()
-
-                buff["event_id"] = number
-                buff["title"] = title
-                buff["participants"] = participants
-                buff["participants_num"] = participants_num
-                buff["discipline"] = discipline
-                buff["place"] = place
-                buff["date_start"] = datetime.datetime.strptime(dates[0], "%d.%m.%Y")
-                buff["date_end"] = datetime.datetime.strptime(dates[1], "%d.%m.%Y")
-                events_list.append(buff)
-
-            table[sport] = events_list
+        for event in get_pdf_events(file_path, workers, chunk_pages):
+            table.setdefault(event.pop("sport"), []).append(event)
 
         files_dict.append(table)
     return files_dict
-
@@ -150,11 +150,11 @@ async def main():
     for contact in parse_regions():
         all_contacts += 1
         user: User = User(email=contact["contact"], name=contact["leader"], region=contact["region"])
-        if user.get() is not None:
+        if await user.get_async() is not None:
             logger.info(f"(RegionsParser) Пользователь {user.email} уже существует")
             continue
 
-        password = user.add_fsp_admin()
+        password = await user.add_fsp_admin_async()
         if password is not None:
             added_counter.append((user.email, password))
 
@@ -10,28 +10,30 @@ import re
 logger = logging.getLogger(__name__)
 
 
-async def get_current_pdf_url(params: dict) -> str:
-    """Получает актуальную ссылку на PDF файл с сайта."""
+async def get_pdf_urls(params: dict) -> list[str]:
+    """Получает актуальные ссылки на PDF файлы (части ЕКП) с сайта в порядке публикации."""
     try:
         async with httpx.AsyncClient(verify=False) as client:
             response = await client.get(params["site_url"])
             response.raise_for_status()
             content = response.text
             
-            file_matches = re.findall(params["pdf_pattern"], content)
+            file_matches = list(dict.fromkeys(re.findall(params["pdf_pattern"], content)))
             
             if file_matches:
-                url = file_matches[0]
-                url = f"https://storage.minsport.gov.ru{url}"
-                logger.info(f"Найдена актуальная ссылка на PDF: {url}")
-                return url
+                urls = [
+                    f"https://storage.minsport.gov.ru{url}"
+                    for url in file_matches[:params.get("pdf_max_files", 1)]
+                ]
+                logger.info(f"Найдены актуальные ссылки на PDF: {urls}")
+                return urls
             
             logger.error("Не удалось найти ссылку на PDF файл")
-            return None
+            return []
             
     except Exception as e:
         logger.error(f"Ошибка при получении ссылки на PDF: {e}")
-        return None
+        return []
 
 
 async def main():
@@ -39,30 +41,58 @@ async def main():
         with open(PARAMS_PATH, 'r') as file:
             params = yaml.safe_load(file)
 
-        # Получаем актуальную ссылку на PDF
-        current_pdf_url = await get_current_pdf_url(params)
-        if not current_pdf_url:
+        # Получаем актуальные ссылки на PDF
+        files_url = await get_pdf_urls(params)
+        if not files_url:
             logger.error("Не удалось получить актуальную ссылку на PDF")
             return []
         
-        # Скачиваем файл только если он изменился
-        files_path = await parsing.fn.save_files([current_pdf_url])
+        # Скачиваем файлы параллельно, только если они изменились
+        files_path = await parsing.fn.save_files(
+            files_url,
+            concurrency=params.get("download_concurrency", parsing.fn.DOWNLOAD_CONCURRENCY),
+            file_timeout=params.get("download_timeout", parsing.fn.DOWNLOAD_FILE_TIMEOUT),
+        )
         if not files_path:
             logger.info("Нет новых файлов для обработки")
             return []
 
-        files_dict = await parsing.fn.extract_pdf_to_table(files_path)
-        result = []
-        Event().drop_table()
-        for all_events in files_dict:
-            for sport, events in all_events.items():
-                for event in events.copy():
-                    event["sport"] = sport
-                    result.append(event)
-                    Event(**event).create()
+        # События читаются потоком и сразу пишутся в БД пачками, в памяти
+        # остаются только их event_id
+        event_ids = []
+
+        def iter_events():
+            for file_path in files_path:
+                for event in parsing.fn.get_pdf_events(
+                    file_path,
+                    workers=params.get("pdf_workers", 1),
+                    chunk_pages=params.get("pdf_chunk_pages", parsing.fn.PDF_CHUNK_PAGES),
+                ):
+                    event_ids.append(event["event_id"])
+                    yield event
 
-        logger.info(f"Успешно обработано {len(result)} событий")
-        return [i["event_id"] for i in result]
+        event_manager = Event()
+        if event_manager.is_empty():
+            stats = event_manager.bulk_load(iter_events())
+            logger.info(
+                f"Первичная загрузка событий: {stats['rows']} строк за {stats['seconds']:.1f} с "
+                f"({stats['rows_per_second']:.0f} строк/с)"
+            )
+        elif params.get("events_load_mode") == "swap":
+            stats = event_manager.reload(iter_events())
+            logger.info(
+                f"Перезагрузка событий через теневую таблицу: {stats['rows']} строк за {stats['seconds']:.1f} с "
+                f"({stats['rows_per_second']:.0f} строк/с)"
+            )
+        else:
+            stats = event_manager.sync(iter_events())
+            logger.info(
+                f"Синхронизация событий: добавлено {stats['inserted']}, обновлено {stats['updated']}, "
+                f"удалено {stats['deleted']}, без изменений {stats['unchanged']}"
+            )
+        parsing.fn.mark_files_loaded(files_url)
+        logger.info(f"Успешно обработано {len(event_ids)} событий")
+        return event_ids
     except Exception as e:
         logger.error(f"Ошибка при выполнении парсера: {e}")
         raise
@@ -309,14 +309,14 @@ async def main():
     for i, event in enumerate(test_events, 1):
         try:
             user = User()
-            if user.get_by_region(event.region) is not None:
+            if await user.get_by_region_async(event.region) is not None:
                 event.representative = user.id
 
-            if event.get_by_self() is not None:
+            if await event.get_by_self_async() is not None:
                 logger.info(f"(Test_fsp_events) Событие {event.title} уже добавлено")
                 continue
 
-            event.add()
+            await event.add_async()
             logger.info(f"(Test_fsp_events) Добавлено событие {i}: {event.title}")
 
         except Exception as e:
@@ -0,0 +1,60 @@
+"""
+Случайная выборка событий (Event.get_random_events_query) на строках с
+заданным sample_key. Нужна база с применёнными миграциями, без неё тесты
+пропускаются. Строки добавляются в транзакции, которая откатывается.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.exc import OperationalError
+
+from DB.DataBase import SessionMaker
+from DB.event import Event
+from DB.models.event import Events
+
+SAMPLE_KEYS = {1: ("A", 0.2), 2: ("A", 0.4), 3: ("A", 0.6), 4: ("A", 0.8), 5: ("B", 0.9)}
+
+
+@pytest.fixture
+def session():
+    session = SessionMaker().session_factory()
+    try:
+        session.execute(text("SELECT 1"))
+    except OperationalError:
+        session.close()
+        pytest.skip("PostgreSQL недоступен")
+
+    try:
+        session.execute(delete(Events))
+        for event_id, (sport, sample_key) in SAMPLE_KEYS.items():
+            session.add(Events(
+                event_id=event_id, sport=sport, title=f"Событие {event_id}", participants="", participants_num="",
+                discipline="", place="", date_start=datetime(2030, 1, 1), date_end=datetime(2030, 1, 2),
+                sample_key=sample_key,
+            ))
+        session.flush()
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+def sample(session, sample_keys: list[float], sport: str | None = None) -> list[int]:
+    query = Event.get_random_events_query(len(sample_keys), sport=sport, sample_keys=sample_keys)
+    return [event.event_id for event in session.scalars(query).all()]
+
+
+def test_each_probe_takes_next_row(session):
+    assert sample(session, [0.3, 0.7, 0.1, 0.4]) == [2, 4, 1, 2]
+
+
+def test_probe_after_last_row_wraps_to_first(session):
+    assert sample(session, [0.95]) == [1]
+    assert sample(session, [0.85], sport="A") == [1]
+    assert sample(session, [0.85]) == [5]
+
+
+def test_duplicates_are_removed_in_probe_order(session):
+    events = session.scalars(Event.get_random_events_query(3, sample_keys=[0.5, 0.3, 0.55])).all()
+    assert [event.event_id for event in Event.get_unique_events(events)] == [3, 2]